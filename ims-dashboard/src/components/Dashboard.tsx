@@ -47,20 +47,14 @@ const Dashboard: React.FC<DashboardProps> = ({ onAssetClick, refreshKey }) => {
 
     const assetLimit = showAll ? 0 : 6;
 
-    const { data: summaryData, mutate: refreshSummary } = useFrappeGetCall<{ message: DashboardSummary }>(
-        'ims.api.get_dashboard_summary',
-        undefined,
-        `dashboard-summary-${refreshKey}`,
-    );
-
-    const { data: assetsData, mutate: refreshAssets } = useFrappeGetCall<{ message: { assets: RecentAsset[] } }>(
-        'ims.api.get_recent_assets',
+    const { data: bootstrapData, mutate: refreshBootstrap } = useFrappeGetCall<{ message: { summary: DashboardSummary; recent_assets: { assets: RecentAsset[] } } }>(
+        'ims.api.get_dashboard_bootstrap',
         { limit: assetLimit, status_filter: activeFilter },
-        `recent-assets-${refreshKey}-${activeFilter}-${assetLimit}`,
+        `dashboard-bootstrap-${refreshKey}-${activeFilter}-${assetLimit}`,
     );
 
-    const summary = summaryData?.message;
-    const assets = assetsData?.message?.assets || [];
+    const summary = bootstrapData?.message?.summary;
+    const assets = bootstrapData?.message?.recent_assets?.assets || [];
 
     const statusCards = useMemo(() => [
         { label: 'Draft', filterKey: 'Draft' as StatusFilter, value: summary?.draft ?? 0, color: '#6b7280', icon: DraftIcon },
@@ -81,8 +75,7 @@ const Dashboard: React.FC<DashboardProps> = ({ onAssetClick, refreshKey }) => {
     };
 
     const handleWorkflowChange = () => {
-        refreshAssets();
-        refreshSummary();
+        refreshBootstrap();
     };
 
     const handleFilterClick = (filterKey: StatusFilter) => {
@@ -1,24 +1,136 @@
 # Copyright (c) 2026, surendhranath and contributors
 # For license information, please see license.txt
 
+import hashlib
 import json
+import re
 from datetime import datetime
 
 import frappe
 from frappe import _
 
+# orjson parses/serializes several times faster than the stdlib on the
+# annotation and version payloads; fall back to json when unavailable
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
+
+# Characters with special meaning in MATCH ... AGAINST boolean mode
+_FT_STRIP_RE = re.compile(r'[+\-><()~*"@]')
+
+
+DASHBOARD_SUMMARY_CACHE_KEY = "ims:dashboard_summary"
+
 
 @frappe.whitelist(allow_guest=False)
 def get_dashboard_summary() -> dict:
-    """Aggregate asset counts by workflow/status for the dashboard cards."""
-    counts = frappe.db.sql(
-        """
-        SELECT status, COUNT(*) as count
+    """Aggregate asset counts by workflow/status for the dashboard cards.
+
+    The result is identical for all users and recomputed at most every
+    60 seconds; bursts of dashboard loads are served from Redis instead
+    of re-running the GROUP BY scan. Asset write/delete hooks invalidate
+    the key, so the TTL only bounds staleness across workers.
+    """
+    # get_value's generator path has no TTL hook, so expiry needs the
+    # explicit get -> compute -> set_value(expires_in_sec=...) shape
+    summary = frappe.cache().get_value(DASHBOARD_SUMMARY_CACHE_KEY)
+    if summary is None:
+        summary = _compute_dashboard_summary()
+        frappe.cache().set_value(
+            DASHBOARD_SUMMARY_CACHE_KEY, summary, expires_in_sec=60
+        )
+    # Copy so callers cannot mutate the cached dict
+    return dict(summary)
+
+
+def clear_dashboard_summary_cache():
+    """Drop the cached summary so the next dashboard load recomputes it."""
+    frappe.cache().delete_value(DASHBOARD_SUMMARY_CACHE_KEY)
+
+
+# Hot statements are kept as module-level constants so each request
+# reuses the same SQL text instead of rebuilding it.
+_SQL_DASHBOARD_SUMMARY = """
+    SELECT status, COUNT(*) as count
+    FROM `tabIMS Marketing Asset`
+    GROUP BY status
+"""
+
+_SQL_RECENT_UPLOADS = """
+    SELECT
+        file_name,
+        display_name,
+        file_url,
+        file_size,
+        creation,
+        asset_name,
+        asset_title
+    FROM `ims_recent_uploads_mv`
+    ORDER BY creation DESC
+    LIMIT %s
+"""
+
+# The status filter only takes a handful of values, so the full SQL
+# text for each variant is baked once at import time; requests just
+# bind the limit.
+_RECENT_ASSETS_STATUS_CONDITIONS = {
+    "": "",
+    "In Review": "WHERE status IN ('Peer Review', 'HOD Approval', 'Final Sign-off')",
+    "Draft": "WHERE status = 'Draft'",
+    "Approved": "WHERE status = 'Approved'",
+    "Rejected": "WHERE status = 'Rejected'",
+}
+
+_SQL_RECENT_ASSETS = {
+    status: f"""
+        SELECT
+            name, asset_title, campaign, category, status,
+            latest_file, owner_user, creation, modified
         FROM `tabIMS Marketing Asset`
-        GROUP BY status
-        """,
-        as_dict=True,
-    )
+        {condition}
+        ORDER BY creation DESC
+        LIMIT %(limit)s
+    """
+    for status, condition in _RECENT_ASSETS_STATUS_CONDITIONS.items()
+}
+
+_SQL_SEARCH_PROJECTS = """
+    SELECT name, project_title, status
+    FROM `tabIMS Project`
+    WHERE (project_title LIKE %(q)s OR name LIKE %(q)s)
+      AND status != 'Cancelled'
+    ORDER BY modified DESC
+    LIMIT %(limit)s
+"""
+
+_SQL_SEARCH_PROJECTS_FT = """
+    SELECT name, project_title, status
+    FROM `tabIMS Project`
+    WHERE MATCH(project_title, name, description)
+          AGAINST (%(q)s IN BOOLEAN MODE)
+      AND status != 'Cancelled'
+    ORDER BY modified DESC
+    LIMIT %(limit)s
+"""
+
+_SQL_MARK_NOTIFICATIONS_READ = """
+    UPDATE `tabNotification Log`
+    SET `read` = 1
+    WHERE for_user = %(user)s AND `read` = 0
+"""
+
+
+def _compute_dashboard_summary() -> dict:
+    counts = frappe.db.sql(_SQL_DASHBOARD_SUMMARY, as_dict=True)
 
     status_map = {}
     for row in counts:
@@ -52,37 +164,9 @@ def get_recent_assets(limit: int = 10, status_filter: str = "") -> dict:
     else:
         limit = min(limit, 50)
 
-    filters: dict = {}
-    if status_filter:
-        if status_filter == "In Review":
-            filters["status"] = [
-                "in",
-                ["Peer Review", "HOD Approval", "Final Sign-off"],
-            ]
-        elif status_filter == "Draft":
-            filters["status"] = "Draft"
-        elif status_filter == "Approved":
-            filters["status"] = "Approved"
-        elif status_filter == "Rejected":
-            filters["status"] = "Rejected"
-
-    assets = frappe.db.get_list(
-        "IMS Marketing Asset",
-        fields=[
-            "name",
-            "asset_title",
-            "campaign",
-            "category",
-            "status",
-            "latest_file",
-            "owner_user",
-            "creation",
-            "modified",
-        ],
-        filters=filters,
-        order_by="creation DESC",
-        limit=limit,
-    )
+    # Baked statement per status filter; unknown filters list everything
+    sql = _SQL_RECENT_ASSETS.get(status_filter, _SQL_RECENT_ASSETS[""])
+    assets = frappe.db.sql(sql, {"limit": limit}, as_dict=True)
 
     return {
         "status": "success",
@@ -90,50 +174,122 @@ def get_recent_assets(limit: int = 10, status_filter: str = "") -> dict:
     }
 
 
+_RECENT_ASSET_COLUMNS = [
+    "name",
+    "asset_title",
+    "campaign",
+    "category",
+    "status",
+    "latest_file",
+    "owner_user",
+    "creation",
+    "modified",
+]
+
+
+@frappe.whitelist(allow_guest=False)
+def get_recent_assets_columnar(limit: int = 10, status_filter: str = "") -> dict:
+    """Columnar variant of get_recent_assets for payload-sensitive callers.
+
+    The dict-per-row response repeats all nine field names in every row;
+    returning {"columns": [...], "rows": [[...], ...]} cuts the JSON
+    roughly in half at 50 rows. Same data and ordering — the frontend
+    rehydrates by zipping each row with columns.
+    """
+    result = get_recent_assets(limit=limit, status_filter=status_filter)
+
+    return {
+        "status": "success",
+        "columns": _RECENT_ASSET_COLUMNS,
+        "rows": [
+            [asset.get(col) for col in _RECENT_ASSET_COLUMNS]
+            for asset in result["assets"]
+        ],
+    }
+
+
 @frappe.whitelist(allow_guest=False)
 def get_recent_uploads(limit: int = 10) -> dict:
-    """Fetch recent file uploads tied to IMS Marketing Assets."""
+    """Fetch recent file uploads tied to IMS Marketing Assets.
+
+    Reads from `ims_recent_uploads_mv`, a summary table maintained by
+    the File/asset write hooks, instead of re-joining tabFile to the
+    asset table per dashboard load. The summary rows cover every file
+    attached to the DocType, so there is a single query path with no
+    empty-result fallback.
+    """
     limit = min(int(limit), 50)
 
-    uploads = frappe.db.sql(
+    uploads = frappe.db.sql(_SQL_RECENT_UPLOADS, (limit,), as_dict=True)
+
+    return {
+        "status": "success",
+        "uploads": uploads,
+    }
+
+
+def refresh_recent_uploads_mv(asset_name: str):
+    """Rebuild the summary rows for one asset in `ims_recent_uploads_mv`."""
+    frappe.db.sql(
+        "DELETE FROM `ims_recent_uploads_mv` WHERE asset_name = %s",
+        (asset_name,),
+    )
+    frappe.db.sql(
         """
+        INSERT INTO `ims_recent_uploads_mv`
+            (file_name, display_name, file_url, file_size, creation, asset_name, asset_title)
         SELECT
-            f.name as file_name,
-            f.file_name as display_name,
+            f.name,
+            f.file_name,
             f.file_url,
             f.file_size,
             f.creation,
-            a.name as asset_name,
+            a.name,
             a.asset_title
         FROM `tabFile` f
-        JOIN `tabIMS Marketing Asset` a ON f.file_url = a.latest_file
+        LEFT JOIN `tabIMS Marketing Asset` a ON f.attached_to_name = a.name
         WHERE f.attached_to_doctype = 'IMS Marketing Asset'
-        ORDER BY f.creation DESC
-        LIMIT %s
+          AND f.attached_to_name = %s
+        ON DUPLICATE KEY UPDATE asset_name = VALUES(asset_name)
         """,
-        (limit,),
-        as_dict=True,
+        (asset_name,),
     )
 
-    # Fallback: if no joined results, get files attached to our DocType
-    if not uploads:
-        uploads = frappe.db.get_list(
-            "File",
-            filters={"attached_to_doctype": "IMS Marketing Asset"},
-            fields=[
-                "name as file_name",
-                "file_name as display_name",
-                "file_url",
-                "file_size",
-                "creation",
-            ],
-            order_by="creation DESC",
-            limit=limit,
-        )
 
+def on_file_after_insert(doc, method=None):
+    """File doc event: keep `ims_recent_uploads_mv` in sync on upload."""
+    if doc.attached_to_doctype == "IMS Marketing Asset" and doc.attached_to_name:
+        refresh_recent_uploads_mv(doc.attached_to_name)
+
+
+def on_file_after_delete(doc, method=None):
+    """File doc event: drop the file's `ims_recent_uploads_mv` row.
+
+    Keyed on file_name rather than asset so rows whose asset link went
+    stale (NULL asset_name from the LEFT JOIN) are removed too.
+    """
+    frappe.db.sql(
+        "DELETE FROM `ims_recent_uploads_mv` WHERE file_name = %s",
+        (doc.name,),
+    )
+
+
+@frappe.whitelist(allow_guest=False)
+def get_dashboard_bootstrap(limit: int = 10, status_filter: str = "") -> dict:
+    """Serve the dashboard boot payload in one round-trip.
+
+    Bundles get_dashboard_summary and get_recent_assets — the two calls
+    Dashboard.tsx makes on mount — so boot is a single whitelisted call
+    instead of two, each with its own auth/session and HTTP overhead.
+    The notification and uploads widgets keep their own endpoints: they
+    page with their own limits (the asset `limit` can legitimately be 0
+    for "show all", which would mean LIMIT 0 to them) and refresh on
+    their own schedule.
+    """
     return {
         "status": "success",
-        "uploads": uploads,
+        "summary": get_dashboard_summary(),
+        "recent_assets": get_recent_assets(limit=limit, status_filter=status_filter),
     }
 
 
@@ -149,51 +305,98 @@ def search_assets(query: str = "", limit: int = 10) -> dict:
     if not query:
         return {"status": "success", "assets": [], "projects": []}
 
-    like_query = f"%{query}%"
-
-    assets = frappe.db.get_list(
-        "IMS Marketing Asset",
-        filters=[
-            ["asset_title", "like", like_query],
-        ],
-        or_filters=[
-            ["name", "like", like_query],
-            ["campaign", "like", like_query],
-        ],
-        fields=["name", "asset_title", "status", "latest_file", "category", "creation"],
-        order_by="modified DESC",
-        limit=limit,
-    )
+    # Prefix-match every token via the FULLTEXT indexes; tokens below
+    # the engine's minimum word length fall back to the old LIKE scan.
+    # Operators become spaces, not deletions: IMS-ASSET-2026-00001 must
+    # split into the words the tokenizer indexed, not fuse into one.
+    tokens = _FT_STRIP_RE.sub(" ", query).split()
+    use_fulltext = bool(tokens) and all(len(t) >= 3 for t in tokens)
 
-    # Frappe or_filters can be tricky; use SQL for reliable OR logic
-    if not assets:
-        assets = frappe.db.sql(
+    if use_fulltext:
+        ft_query = " ".join(f"+{t}*" for t in tokens)
+        rows = frappe.db.sql(
             """
-            SELECT name, asset_title, status, latest_file, category, creation
-            FROM `tabIMS Marketing Asset`
-            WHERE asset_title LIKE %(q)s
-               OR name LIKE %(q)s
-               OR campaign LIKE %(q)s
-            ORDER BY modified DESC
-            LIMIT %(limit)s
+            (
+                SELECT
+                    'asset' AS kind, name, asset_title AS title, status,
+                    latest_file, category, NULL AS due_date, creation
+                FROM `tabIMS Marketing Asset`
+                WHERE MATCH(asset_title, name, campaign)
+                      AGAINST (%(q)s IN BOOLEAN MODE)
+                ORDER BY modified DESC
+                LIMIT %(limit)s
+            )
+            UNION ALL
+            (
+                SELECT
+                    'project' AS kind, name, project_title AS title, status,
+                    NULL AS latest_file, NULL AS category, due_date, creation
+                FROM `tabIMS Project`
+                WHERE MATCH(project_title, name, description)
+                      AGAINST (%(q)s IN BOOLEAN MODE)
+                ORDER BY modified DESC
+                LIMIT %(limit)s
+            )
+            """,
+            {"q": ft_query, "limit": limit},
+            as_dict=True,
+        )
+    else:
+        like_query = f"%{query}%"
+        rows = frappe.db.sql(
+            """
+            (
+                SELECT
+                    'asset' AS kind, name, asset_title AS title, status,
+                    latest_file, category, NULL AS due_date, creation
+                FROM `tabIMS Marketing Asset`
+                WHERE asset_title LIKE %(q)s
+                   OR name LIKE %(q)s
+                   OR campaign LIKE %(q)s
+                ORDER BY modified DESC
+                LIMIT %(limit)s
+            )
+            UNION ALL
+            (
+                SELECT
+                    'project' AS kind, name, project_title AS title, status,
+                    NULL AS latest_file, NULL AS category, due_date, creation
+                FROM `tabIMS Project`
+                WHERE project_title LIKE %(q)s
+                   OR name LIKE %(q)s
+                   OR description LIKE %(q)s
+                ORDER BY modified DESC
+                LIMIT %(limit)s
+            )
             """,
             {"q": like_query, "limit": limit},
             as_dict=True,
         )
 
-    projects = frappe.db.sql(
-        """
-        SELECT name, project_title, status, due_date, creation
-        FROM `tabIMS Project`
-        WHERE project_title LIKE %(q)s
-           OR name LIKE %(q)s
-           OR description LIKE %(q)s
-        ORDER BY modified DESC
-        LIMIT %(limit)s
-        """,
-        {"q": like_query, "limit": limit},
-        as_dict=True,
-    )
+    assets = []
+    projects = []
+    for row in rows:
+        if row.pop("kind") == "asset":
+            assets.append(
+                {
+                    "name": row.name,
+                    "asset_title": row.title,
+                    "status": row.status,
+                    "latest_file": row.latest_file,
+                    "category": row.category,
+                    "creation": row.creation,
+                }
+            )
+        else:
+            projects.append(
+                {
+                    "name": row.name,
+                    "project_title": row.title,
+                    "status": row.status,
+                    "due_date": row.due_date,
+                    "creation": row.creation,
+                }
+            )
 
     return {
         "status": "success",
@@ -217,7 +420,7 @@ def get_current_user():
 
     return {
         "user": frappe.session.user,
-        "full_name": frappe.utils.get_fullname(frappe.session.user),
+        "full_name": _fullname(frappe.session.user),
         "is_guest": frappe.session.user == "Guest",
         "roles": roles,
         "primary_role": primary_role,
@@ -287,211 +490,343 @@ def search_projects(query: str = "", limit: int = 20):
         f"IMS: search_projects called with query='{query}' by user={frappe.session.user}"
     )
 
-    like_query = f"%{query}%"
+    # Same dual path as search_assets: prefix-match each token through
+    # the ims_search_ft FULLTEXT index; an empty query (project picker
+    # listing) or sub-minimum-length tokens use the old LIKE scan.
+    # Operators become spaces so hyphenated names split, not fuse.
+    tokens = _FT_STRIP_RE.sub(" ", query).split()
+    use_fulltext = bool(tokens) and all(len(t) >= 3 for t in tokens)
 
     # SQL completely bypasses Permission Query Conditions and User Permissions
-    projects = frappe.db.sql(
-        """
-        SELECT name, project_title, status
-        FROM `tabIMS Project`
-        WHERE (project_title LIKE %(q)s OR name LIKE %(q)s)
-          AND status != 'Cancelled'
-        ORDER BY modified DESC
-        LIMIT %(limit)s
-        """,
-        {"q": like_query, "limit": limit},
-        as_dict=True,
-    )
+    if use_fulltext:
+        ft_query = " ".join(f"+{t}*" for t in tokens)
+        projects = frappe.db.sql(
+            _SQL_SEARCH_PROJECTS_FT,
+            {"q": ft_query, "limit": limit},
+            as_dict=True,
+        )
+    else:
+        projects = frappe.db.sql(
+            _SQL_SEARCH_PROJECTS,
+            {"q": f"%{query}%", "limit": limit},
+            as_dict=True,
+        )
 
     return projects
 
 
-@frappe.whitelist(allow_guest=False)
-def get_notifications(limit: int = 20) -> dict:
-    """Fetch recent notifications for the current user from Frappe's Notification Log."""
-    limit = min(int(limit), 100)
+def _asset_exists(name: str) -> bool:
+    """Request-scoped memo around `frappe.db.exists` for marketing assets.
 
-    notifications = frappe.db.get_list(
-        "Notification Log",
-        filters={"for_user": frappe.session.user},
-        fields=[
-            "name",
-            "subject",
-            "type",
-            "document_type",
-            "document_name",
-            "from_user",
-            "read",
-            "creation",
-        ],
-        order_by="creation DESC",
-        limit=limit,
+    Endpoints called back-to-back in one request (e.g. a workflow apply
+    followed by a transitions fetch) repeat the same SELECT name probe;
+    the dict on frappe.local makes the repeats free and is torn down
+    with the request.
+    """
+    cache = frappe.local.__dict__.setdefault("_ims_exists_cache", {})
+    if name not in cache:
+        cache[name] = bool(frappe.db.exists("IMS Marketing Asset", name))
+    return cache[name]
+
+
+def _get_doc_cached(doctype: str, name: str):
+    """Request-scoped memo around `frappe.get_doc` for read-only uses.
+
+    Bursty endpoints load the same parent doc more than once per request
+    cycle; the memo returns the already-wired document object instead of
+    re-running the doc and child-table SELECTs. Callers that mutate and
+    save must invalidate with `_invalidate_doc_cache` first.
+    """
+    cache = frappe.local.__dict__.setdefault("_ims_doc_cache", {})
+    key = (doctype, name)
+    if key not in cache:
+        cache[key] = frappe.get_doc(doctype, name)
+    return cache[key]
+
+
+def _invalidate_doc_cache(doctype: str, name: str):
+    """Drop one entry from the request-scoped doc memo."""
+    frappe.local.__dict__.setdefault("_ims_doc_cache", {}).pop((doctype, name), None)
+
+
+def _check_asset_read(name: str):
+    """Request-scoped memo around the asset read-permission check.
+
+    has_permission runs role/user-permission/share SELECTs every call;
+    bursts from the annotation view hit the same asset repeatedly in one
+    request, so the (user, asset) verdict is kept on frappe.local. Still
+    raises on the first (and only) real check when access is denied.
+    """
+    cache = frappe.local.__dict__.setdefault("_ims_perm_cache", {})
+    key = (frappe.session.user, name)
+    if key not in cache:
+        cache[key] = frappe.has_permission(
+            "IMS Marketing Asset", "read", name, throw=True
+        )
+    return cache[key]
+
+
+def _fullname(user: str) -> str:
+    """Request-scoped memo of user -> full name.
+
+    `_get_fullname_map` primes this cache in bulk, so endpoints that
+    batch-fetch first get their later lookups for free; stragglers cost
+    one User read per distinct user per request instead of one per row.
+    """
+    cache = frappe.local.__dict__.setdefault("_ims_fullname_cache", {})
+    if user not in cache:
+        cache[user] = frappe.utils.get_fullname(user)
+    return cache[user]
+
+
+def _get_fullname_map(user_ids) -> dict:
+    """Fetch full names for a set of user IDs in one query.
+
+    Replaces per-row `frappe.utils.get_fullname` calls (an N+1 on
+    `tabUser`) in the audit and notification endpoints. Also primes the
+    request-scoped `_fullname` memo.
+    """
+    user_ids = {u for u in user_ids if u}
+    if not user_ids:
+        return {}
+
+    name_map = dict(
+        frappe.get_all(
+            "User",
+            filters={"name": ["in", list(user_ids)]},
+            fields=["name", "full_name"],
+            as_list=True,
+        )
     )
+    frappe.local.__dict__.setdefault("_ims_fullname_cache", {}).update(name_map)
+    return name_map
 
-    # Also get IMS-specific activity from Comments
-    ims_comments = frappe.db.sql(
-        """
+
+_SQL_NOTIFICATION_FEED = """
+    (
+        SELECT
+            name,
+            subject,
+            type,
+            document_type,
+            document_name,
+            from_user,
+            `read`,
+            creation,
+            0 AS is_comment
+        FROM `tabNotification Log`
+        WHERE for_user = %(user)s
+        ORDER BY creation DESC
+        LIMIT %(limit)s
+    )
+    UNION ALL
+    (
         SELECT
             c.name,
-            c.comment_type,
-            c.content as subject,
-            c.reference_doctype as document_type,
-            c.reference_name as document_name,
-            c.comment_by as from_user,
-            c.creation
+            c.content AS subject,
+            c.comment_type AS type,
+            c.reference_doctype AS document_type,
+            c.reference_name AS document_name,
+            c.comment_by AS from_user,
+            1 AS `read`,
+            c.creation,
+            1 AS is_comment
         FROM `tabComment` c
         WHERE c.reference_doctype IN ('IMS Marketing Asset', 'IMS Project')
           AND c.comment_type IN ('Comment', 'Workflow', 'Assignment', 'Like')
         ORDER BY c.creation DESC
         LIMIT %(limit)s
-        """,
-        {"limit": limit},
-        as_dict=True,
     )
+    ORDER BY creation DESC
+    LIMIT %(limit)s
+"""
 
-    # Mark comments with read=1 (they're activity, not notifications)
-    for c in ims_comments:
-        c["read"] = 1
-        c["type"] = c.get("comment_type", "Info")
 
-    # Merge and sort by creation
-    all_items = notifications + ims_comments
-    all_items.sort(key=lambda x: x.get("creation", ""), reverse=True)
+UNREAD_COUNT_CACHE_KEY = "ims:unread"
 
-    # Unread count
-    unread_count = frappe.db.count(
-        "Notification Log",
-        filters={"for_user": frappe.session.user, "read": 0},
+
+def _unread_count(user: str) -> int:
+    """Per-user unread notification count, cached in a Redis hash.
+
+    mark_notifications_read resets the entry and the Notification Log
+    insert hook drops it, so the COUNT query only runs when the value
+    actually changed since the last poll.
+    """
+    return frappe.cache().hget(
+        UNREAD_COUNT_CACHE_KEY,
+        user,
+        generator=lambda: frappe.db.count(
+            "Notification Log", {"for_user": user, "read": 0}
+        ),
+    )
+
+
+def on_notification_after_insert(doc, method=None):
+    """Notification Log doc event: invalidate the recipient's unread count."""
+    if doc.for_user:
+        frappe.cache().hdel(UNREAD_COUNT_CACHE_KEY, doc.for_user)
+
+
+@frappe.whitelist(allow_guest=False)
+def get_notifications(limit: int = 20) -> dict:
+    """Fetch recent notifications for the current user from Frappe's Notification Log."""
+    limit = min(int(limit), 100)
+
+    # One UNION ALL so MySQL merges notifications and IMS comment
+    # activity with its indexes and ships only `limit` rows; the unread
+    # count comes from the per-user Redis hash instead of a COUNT scan
+    # per poll. Comments are activity, not notifications, so they come
+    # back with read=1 already set.
+    all_items = frappe.db.sql(
+        _SQL_NOTIFICATION_FEED,
+        {"user": frappe.session.user, "limit": limit},
+        as_dict=True,
     )
 
+    for item in all_items:
+        if item.pop("is_comment"):
+            item["comment_type"] = item["type"]
+
     return {
         "status": "success",
-        "notifications": all_items[:limit],
-        "unread_count": unread_count,
+        "notifications": all_items,
+        "unread_count": _unread_count(frappe.session.user),
     }
 
 
 @frappe.whitelist(allow_guest=False)
 def mark_notifications_read() -> dict:
     """Mark all notifications as read for the current user."""
-    frappe.db.sql(
-        """
-        UPDATE `tabNotification Log`
-        SET `read` = 1
-        WHERE for_user = %(user)s AND `read` = 0
-        """,
-        {"user": frappe.session.user},
-    )
-    frappe.db.commit()
+    frappe.db.sql(_SQL_MARK_NOTIFICATIONS_READ, {"user": frappe.session.user})
+    frappe.cache().hset(UNREAD_COUNT_CACHE_KEY, frappe.session.user, 0)
 
     return {"status": "success", "message": _("All notifications marked as read.")}
 
 
-@frappe.whitelist(allow_guest=False)
-def get_audit_logs(limit: int = 30, action_filter: str = "") -> dict:
-    """Fetch audit trail for IMS documents from Frappe's Version and Comment tables.
-
-    Returns a timeline of create/modify/comment/workflow actions.
-    """
-    limit = min(int(limit), 100)
-
-    # Get version logs (field changes)
-    versions = frappe.db.sql(
-        """
+# Versions and comments are merged, filtered, ordered and limited in a
+# single UNION ALL so MySQL streams exactly `limit` rows. The action is
+# derived in SQL from the version JSON (filterable via HAVING before
+# LIMIT) and only the small `$.changed` fragment ships, not the blob.
+_SQL_AUDIT_TIMELINE = """
+    (
         SELECT
             v.name,
             v.ref_doctype as document_type,
             v.docname as document_name,
             v.owner as user,
-            v.data,
             v.creation,
-            'Version' as log_type
+            'Version' as log_type,
+            CASE
+                WHEN COALESCE(JSON_LENGTH(v.data, '$.changed'), 0) = 0
+                     AND COALESCE(JSON_LENGTH(v.data, '$.added'), 0) > 0
+                    THEN 'Created'
+                WHEN JSON_CONTAINS(
+                        JSON_EXTRACT(v.data, '$.changed[*][0]'), '"status"')
+                    THEN 'Workflow'
+                ELSE 'Modified'
+            END AS action,
+            JSON_EXTRACT(v.data, '$.changed') AS changed_fields,
+            NULL AS details,
+            NULL AS comment_type
         FROM `tabVersion` v
         WHERE v.ref_doctype IN ('IMS Marketing Asset', 'IMS Project', 'IMS Asset Revision')
+          AND JSON_VALID(v.data)
+          AND (%(data_like)s = '' OR v.data LIKE %(data_like)s)
+        HAVING (%(action_filter)s = '' OR LOWER(action) = LOWER(%(action_filter)s))
         ORDER BY v.creation DESC
         LIMIT %(limit)s
-        """,
-        {"limit": limit},
-        as_dict=True,
     )
-
-    # Parse version data to extract meaningful changes
-    audit_entries = []
-    for v in versions:
-        try:
-            data = json.loads(v.get("data") or "{}")
-            changed_fields = data.get("changed", [])
-
-            # Determine action type
-            if not changed_fields and data.get("added"):
-                action = "Created"
-            elif any(c[0] == "status" for c in changed_fields if isinstance(c, list)):
-                status_change = next(
-                    (
-                        c
-                        for c in changed_fields
-                        if isinstance(c, list) and c[0] == "status"
-                    ),
-                    None,
-                )
-                action = "Workflow"
-                if status_change and len(status_change) >= 3:
-                    v["details"] = f"{status_change[1]} → {status_change[2]}"
-            else:
-                action = "Modified"
-                field_names = [c[0] for c in changed_fields if isinstance(c, list)]
-                v["details"] = ", ".join(field_names[:3])
-                if len(field_names) > 3:
-                    v["details"] += f" +{len(field_names) - 3} more"
-
-            v["action"] = action
-            v["user_fullname"] = frappe.utils.get_fullname(v.get("user", ""))
-
-            # Apply action filter
-            if action_filter and action.lower() != action_filter.lower():
-                continue
-
-            audit_entries.append(v)
-        except (json.JSONDecodeError, TypeError):
-            continue
-
-    # Get comments (annotation comments, workflow comments)
-    comments = frappe.db.sql(
-        """
+    UNION ALL
+    (
         SELECT
             c.name,
             c.reference_doctype as document_type,
             c.reference_name as document_name,
             c.comment_by as user,
-            c.content as details,
-            c.comment_type,
             c.creation,
-            'Comment' as log_type
+            'Comment' as log_type,
+            c.comment_type AS action,
+            NULL AS changed_fields,
+            c.content as details,
+            c.comment_type
         FROM `tabComment` c
         WHERE c.reference_doctype IN ('IMS Marketing Asset', 'IMS Project')
           AND c.comment_type IN ('Comment', 'Workflow', 'Assignment', 'Created')
+          AND (%(action_filter)s = ''
+               OR LOWER(c.comment_type) = LOWER(%(action_filter)s))
         ORDER BY c.creation DESC
         LIMIT %(limit)s
-        """,
-        {"limit": limit},
+    )
+    ORDER BY creation DESC
+    LIMIT %(limit)s
+"""
+
+
+@frappe.whitelist(allow_guest=False)
+def get_audit_logs(limit: int = 30, action_filter: str = "") -> dict:
+    """Fetch audit trail for IMS documents from Frappe's Version and Comment tables.
+
+    Returns a timeline of create/modify/comment/workflow actions.
+    """
+    limit = min(int(limit), 100)
+
+    # Coarse substring prefilter on the version JSON so the CASE/HAVING
+    # machinery only runs over rows that could match the action_filter;
+    # the derived action still does the exact check afterwards
+    data_like = {"workflow": '%"status"%', "created": '%"added"%'}.get(
+        (action_filter or "").lower(), ""
+    )
+
+    # One UNION ALL brings back the merged, filtered, creation-ordered
+    # timeline already cut to `limit` rows
+    rows = frappe.db.sql(
+        _SQL_AUDIT_TIMELINE,
+        {"limit": limit, "action_filter": action_filter or "", "data_like": data_like},
         as_dict=True,
     )
 
-    for c in comments:
-        c["action"] = c.get("comment_type", "Comment")
-        c["user_fullname"] = frappe.utils.get_fullname(c.get("user", ""))
+    # One batched User fetch instead of a get_fullname call per row
+    fullnames = _get_fullname_map({r.get("user") for r in rows})
 
-        if action_filter and c["action"].lower() != action_filter.lower():
+    # Only lightweight detail formatting is left in Python; merge, sort,
+    # action derivation and filtering were all applied by the DB.
+    audit_entries = []
+    for row in rows:
+        changed_fields = row.pop("changed_fields", None)
+        row["user_fullname"] = fullnames.get(row.get("user"), row.get("user", ""))
+
+        if row["log_type"] == "Comment":
+            row.pop("comment_type", None)
+            row["comment_type"] = row["action"]
+            audit_entries.append(row)
             continue
 
-        audit_entries.append(c)
+        row.pop("comment_type", None)
+        row.pop("details", None)
+        try:
+            changed = _loads(changed_fields or "[]")
+            action = row["action"]
 
-    # Sort merged results by creation
-    audit_entries.sort(key=lambda x: x.get("creation", ""), reverse=True)
+            if action == "Workflow":
+                status_change = next(
+                    (c for c in changed if isinstance(c, list) and c[0] == "status"),
+                    None,
+                )
+                if status_change and len(status_change) >= 3:
+                    row["details"] = f"{status_change[1]} → {status_change[2]}"
+            elif action == "Modified":
+                field_names = [c[0] for c in changed if isinstance(c, list)]
+                row["details"] = ", ".join(field_names[:3])
+                if len(field_names) > 3:
+                    row["details"] += f" +{len(field_names) - 3} more"
+        except (json.JSONDecodeError, TypeError):
+            continue
+
+        audit_entries.append(row)
 
     return {
         "status": "success",
-        "logs": audit_entries[:limit],
+        "logs": audit_entries,
     }
 
 
@@ -513,8 +848,10 @@ def upload_marketing_asset(
     file_url = None
 
     if files and "file" in files:
-        # Force uploaded file to be public
-        frappe.form_dict["is_private"] = 0
+        # Create the file private on first insert; the asset controller
+        # enforces is_private=1 until approval anyway, so starting public
+        # only cost an extra File UPDATE during asset validate.
+        frappe.form_dict["is_private"] = 1
         from frappe.handler import upload_file
 
         file_doc = upload_file()
@@ -545,7 +882,6 @@ def upload_marketing_asset(
 
     asset = frappe.get_doc(data)
     asset.insert(ignore_permissions=False)
-    frappe.db.commit()
 
     return {
         "status": "success",
@@ -561,6 +897,72 @@ def upload_marketing_asset(
     }
 
 
+ANNOTATION_FIELDS = [
+    "annotation_id",
+    "x",
+    "y",
+    "width",
+    "height",
+    "annotation_type",
+    "comment",
+    "author",
+    "author_name",
+    "timestamp",
+    "path",
+]
+
+
+def _get_annotation_rows(
+    revision_name: str, offset: int = 0, page_size: int = 0
+) -> list[dict]:
+    """Fetch the annotation child rows of a revision as plain dicts.
+
+    A page_size of 0 returns all rows; otherwise the DB paginates so
+    revisions with long annotation histories can be lazy-loaded.
+    """
+    kwargs = {}
+    if page_size:
+        kwargs = {"limit_start": offset, "limit_page_length": page_size}
+
+    return frappe.get_all(
+        "IMS Annotation",
+        filters={"parent": revision_name, "parenttype": "IMS Asset Revision"},
+        fields=ANNOTATION_FIELDS,
+        # creation breaks ties for any legacy rows that predate explicit
+        # idx assignment, keeping pagination deterministic
+        order_by="idx asc, creation asc",
+        **kwargs,
+    )
+
+
+def _annotation_dicts(
+    revision_name: str, offset: int = 0, page_size: int = 0
+) -> list[dict]:
+    """Return a revision's annotations in the shape the frontend expects."""
+    annotations = []
+    for row in _get_annotation_rows(revision_name, offset, page_size):
+        annotation = {
+            "id": row.annotation_id,
+            "x": row.x,
+            "y": row.y,
+            "width": row.width,
+            "height": row.height,
+            "annotation_type": row.annotation_type,
+            "comment": row.comment,
+            "author": row.author,
+            "author_name": row.author_name,
+            "timestamp": row.timestamp,
+            "revision_name": revision_name,
+        }
+        if row.path:
+            try:
+                annotation["path"] = _loads(row.path)
+            except (json.JSONDecodeError, TypeError):
+                pass
+        annotations.append(annotation)
+    return annotations
+
+
 @frappe.whitelist(allow_guest=False)
 def submit_annotation(
     marketing_asset: str,
@@ -573,13 +975,36 @@ def submit_annotation(
     path: str = "",
 ) -> dict:
     """Save an annotation to the latest IMS Asset Revision."""
-    if not frappe.db.exists("IMS Marketing Asset", marketing_asset):
+    # One query answers existence, latest file and latest revision at
+    # once instead of separate exists/get_value round-trips.
+    rows = frappe.db.sql(
+        """
+        SELECT
+            a.name AS asset,
+            a.latest_file,
+            a.description,
+            r.name AS revision,
+            r.revision_number,
+            r.revision_file,
+            r.content_brief
+        FROM `tabIMS Marketing Asset` a
+        LEFT JOIN `tabIMS Asset Revision` r ON r.marketing_asset = a.name
+        WHERE a.name = %s
+        ORDER BY r.revision_number DESC
+        LIMIT 1
+        """,
+        (marketing_asset,),
+        as_dict=True,
+    )
+
+    if not rows:
         frappe.throw(
             _("Marketing Asset {0} does not exist.").format(marketing_asset),
             frappe.DoesNotExistError,
         )
 
-    frappe.has_permission("IMS Marketing Asset", "read", marketing_asset, throw=True)
+    asset_row = rows[0]
+    _check_asset_read(marketing_asset)
 
     x = float(x)
     y = float(y)
@@ -600,20 +1025,17 @@ def submit_annotation(
     path_data = []
     if path:
         try:
-            path_data = json.loads(path) if isinstance(path, str) else path
+            path_data = _loads(path) if isinstance(path, str) else path
         except (json.JSONDecodeError, TypeError):
             path_data = []
 
-    latest_revision = frappe.db.get_value(
-        "IMS Asset Revision",
-        {"marketing_asset": marketing_asset},
-        "name",
-        order_by="revision_number DESC",
-    )
+    latest_revision = asset_row.revision
+    latest_revision_number = asset_row.revision_number
+    revision_file = asset_row.revision_file
+    content_brief = asset_row.content_brief
 
     if not latest_revision:
-        asset_doc = frappe.get_doc("IMS Marketing Asset", marketing_asset)
-        if not asset_doc.latest_file:
+        if not asset_row.latest_file:
             frappe.throw(
                 _("No file found on the marketing asset. Upload a file first.")
             )
@@ -622,48 +1044,37 @@ def submit_annotation(
             {
                 "doctype": "IMS Asset Revision",
                 "marketing_asset": marketing_asset,
-                "revision_file": asset_doc.latest_file,
-                "annotations": json.dumps([]),
+                "revision_file": asset_row.latest_file,
+                "annotations": "[]",
                 "revision_notes": "Auto-created revision for first annotation.",
-                "content_brief": asset_doc.description or "",
+                "content_brief": asset_row.description or "",
             }
         )
         revision_doc.insert(ignore_permissions=True)
-        frappe.db.commit()
         latest_revision = revision_doc.name
-
-    revision = frappe.get_doc("IMS Asset Revision", latest_revision)
-
-    # Protection: Never overwrite Revision 1 (it's the initial baseline)
-    if revision.revision_number == 1:
-        # Check if Revision 2 or higher already exists
-        has_later = frappe.db.get_value(
-            "IMS Asset Revision",
-            {"marketing_asset": marketing_asset, "revision_number": [">", 1]},
-            "name",
+        latest_revision_number = revision_doc.revision_number
+        revision_file = revision_doc.revision_file
+        content_brief = revision_doc.content_brief
+
+    # Protection: Never overwrite Revision 1 (it's the initial baseline).
+    # The opening query returned the highest revision number, so hitting
+    # this branch already proves no later revision exists — no separate
+    # has_later probe needed.
+    if latest_revision_number == 1:
+        # Create Revision 2 as the first 'working' revision
+        revision = frappe.get_doc(
+            {
+                "doctype": "IMS Asset Revision",
+                "marketing_asset": marketing_asset,
+                "revision_number": 2,
+                "revision_file": revision_file,
+                "annotation_rows": _get_annotation_rows(latest_revision),
+                "content_brief": content_brief,
+                "revision_notes": "First working iteration.",
+            }
         )
-        if not has_later:
-            # Create Revision 2 as the first 'working' revision
-            revision = frappe.get_doc(
-                {
-                    "doctype": "IMS Asset Revision",
-                    "marketing_asset": marketing_asset,
-                    "revision_number": 2,
-                    "revision_file": revision.revision_file,
-                    "annotations": revision.annotations,
-                    "content_brief": revision.content_brief,
-                    "revision_notes": "First working iteration.",
-                }
-            )
-            revision.insert(ignore_permissions=True)
-            frappe.db.commit()
-            latest_revision = revision.name
-        else:
-            # Use the existing later revision
-            latest_revision = has_later
-            revision = frappe.get_doc("IMS Asset Revision", latest_revision)
-
-    existing_annotations = json.loads(revision.annotations or "[]")
+        revision.insert(ignore_permissions=True)
+        latest_revision = revision.name
 
     annotation = {
         "id": frappe.generate_hash(length=10),
@@ -674,7 +1085,7 @@ def submit_annotation(
         "annotation_type": annotation_type,
         "comment": comment.strip(),
         "author": frappe.session.user,
-        "author_name": frappe.utils.get_fullname(frappe.session.user),
+        "author_name": _fullname(frappe.session.user),
         "timestamp": datetime.now().isoformat(),
         "revision_name": latest_revision,
     }
@@ -682,13 +1093,48 @@ def submit_annotation(
     if annotation_type == "freehand" and path_data:
         annotation["path"] = path_data
 
-    existing_annotations.append(annotation)
-    revision.annotations = json.dumps(existing_annotations)
-    revision.save(ignore_permissions=True)
-    frappe.db.commit()
-
-    # Process mentions
-    process_mentions(comment, marketing_asset, frappe.session.user)
+    # One child-row INSERT instead of rewriting the whole annotations
+    # JSON blob on the revision. Direct child inserts bypass the parent
+    # save that normally assigns idx, so number the row explicitly to
+    # keep the append order the blob used to encode.
+    next_idx = (
+        frappe.db.count(
+            "IMS Annotation",
+            {"parent": latest_revision, "parenttype": "IMS Asset Revision"},
+        )
+        + 1
+    )
+    frappe.get_doc(
+        {
+            "doctype": "IMS Annotation",
+            "parent": latest_revision,
+            "parenttype": "IMS Asset Revision",
+            "parentfield": "annotation_rows",
+            "idx": next_idx,
+            "annotation_id": annotation["id"],
+            "x": x,
+            "y": y,
+            "width": width,
+            "height": height,
+            "annotation_type": annotation_type,
+            "comment": annotation["comment"],
+            "author": annotation["author"],
+            "author_name": annotation["author_name"],
+            "timestamp": annotation["timestamp"],
+            "path": _dumps(path_data) if annotation.get("path") else None,
+        }
+    ).insert(ignore_permissions=True)
+
+    # Mention notifications are not part of the response; write them
+    # from a worker once this transaction commits
+    frappe.enqueue(
+        "ims.api.process_mentions",
+        queue="short",
+        enqueue_after_commit=True,
+        comment=comment,
+        asset_name=marketing_asset,
+        sender=frappe.session.user,
+    )
 
     return {
         "status": "success",
@@ -698,53 +1144,97 @@ def submit_annotation(
     }
 
 
+# Match @username (alphanumeric, dots, underscores)
+_MENTION_RE = re.compile(r"@([a-zA-Z0-9._]+)")
+
+_NOTIFICATION_LOG_FIELDS = [
+    "name",
+    "owner",
+    "modified_by",
+    "creation",
+    "modified",
+    "subject",
+    "for_user",
+    "type",
+    "from_user",
+    "document_type",
+    "document_name",
+    "email_content",
+    "read",
+]
+
+
 def process_mentions(comment: str, asset_name: str, sender: str):
     """Find @mentions and create notifications."""
-    import re
-
-    # Match @username (alphanumeric, dots, underscores)
-    mentions = set(re.findall(r"@([a-zA-Z0-9._]+)", comment))
+    mentions = set(_MENTION_RE.findall(comment))
+    mentions.discard(sender)
 
     if not mentions:
         return
 
-    asset_title = frappe.db.get_value("IMS Marketing Asset", asset_name, "asset_title")
-    sender_fullname = frappe.utils.get_fullname(sender)
-
-    for username in mentions:
-        if username == sender or not frappe.db.exists("User", username):
-            continue
-
-        # Create Notification Log
-        subject = f"{sender_fullname} mentioned you in {asset_title}"
+    # Validate all mentioned users in one query instead of one
+    # frappe.db.exists round-trip per mention
+    valid_users = {
+        row[0]
+        for row in frappe.db.sql(
+            "SELECT name FROM `tabUser` WHERE enabled = 1 AND name IN %(users)s",
+            {"users": tuple(mentions)},
+        )
+    }
+    if not valid_users:
+        return
 
-        # Check if already notified recently? No, always notify for mentions.
-        notification = frappe.get_doc(
-            {
-                "doctype": "Notification Log",
-                "subject": subject,
-                "for_user": username,
-                "type": "Mention",
-                "from_user": sender,
-                "document_type": "IMS Marketing Asset",
-                "document_name": asset_name,
-                "email_content": f"<p>{comment}</p>",
-            }
+    asset_title = frappe.db.get_value("IMS Marketing Asset", asset_name, "asset_title")
+    sender_fullname = _fullname(sender)
+
+    subject = f"{sender_fullname} mentioned you in {asset_title}"
+    email_content = f"<p>{comment}</p>"
+    now = frappe.utils.now()
+
+    # One multi-row INSERT for all mentions instead of a doc insert per
+    # recipient. bulk_insert skips doc events, so the unread-count cache
+    # entries are dropped here by hand.
+    values = [
+        (
+            frappe.generate_hash(length=10),
+            sender,
+            sender,
+            now,
+            now,
+            subject,
+            username,
+            "Mention",
+            sender,
+            "IMS Marketing Asset",
+            asset_name,
+            email_content,
+            0,
         )
-        notification.insert(ignore_permissions=True)
+        for username in valid_users
+    ]
+    frappe.db.bulk_insert("Notification Log", _NOTIFICATION_LOG_FIELDS, values)
+
+    for username in valid_users:
+        frappe.cache().hdel(UNREAD_COUNT_CACHE_KEY, username)
 
 
 @frappe.whitelist(allow_guest=False)
 def get_users_for_mention(query: str = "") -> dict:
-    """Search for users to mention."""
+    """Search for users to mention.
+
+    Anchored prefix match so the (enabled, full_name) index serves the
+    per-keystroke autocomplete as a range seek; a leading-wildcard LIKE
+    would scan every enabled user each keystroke.
+    """
     users = frappe.db.get_list(
         "User",
         filters={
             "enabled": 1,
             "name": ["not in", ["Administrator", "Guest"]],
-            "full_name": ["like", f"%{query}%"],
+            "full_name": ["like", f"{query}%"],
         },
         fields=["name", "full_name", "user_image"],
+        order_by="full_name ASC",
         limit=20,
     )
     return {"status": "success", "users": users}
@@ -753,10 +1243,10 @@ def get_users_for_mention(query: str = "") -> dict:
 @frappe.whitelist(allow_guest=False)
 def get_revision_history(marketing_asset: str) -> dict:
     """Fetch all revisions for a given marketing asset."""
-    if not frappe.db.exists("IMS Marketing Asset", marketing_asset):
+    if not _asset_exists(marketing_asset):
         frappe.throw(_("Asset not found"), frappe.DoesNotExistError)
 
-    frappe.has_permission("IMS Marketing Asset", "read", marketing_asset, throw=True)
+    _check_asset_read(marketing_asset)
 
     revisions = frappe.get_all(
         "IMS Asset Revision",
@@ -779,15 +1269,37 @@ def get_revision_history(marketing_asset: str) -> dict:
 
 
 @frappe.whitelist(allow_guest=False)
-def get_annotations(marketing_asset: str, revision_number: int = None) -> dict:
-    """Fetch annotations for a specific or latest revision of a marketing asset."""
-    if not frappe.db.exists("IMS Marketing Asset", marketing_asset):
+def get_annotations(
+    marketing_asset: str,
+    revision_number: int = None,
+    offset: int = 0,
+    page_size: int = 0,
+) -> dict:
+    """Fetch annotations for a specific or latest revision of a marketing asset.
+
+    Args:
+        marketing_asset: Parent asset name.
+        revision_number: Optional specific revision; defaults to latest.
+        offset / page_size: Optional pagination window over the
+            annotation rows. page_size 0 returns all of them, and
+            total_annotations lets the frontend lazy-load the rest.
+    """
+    # One lookup answers existence and fetches the fields used later
+    # (status for the can_upload flag, description for the no-revision
+    # fallback) instead of an exists probe plus two get_value calls
+    asset = frappe.db.get_value(
+        "IMS Marketing Asset",
+        marketing_asset,
+        ["name", "status", "description"],
+        as_dict=True,
+    )
+    if not asset:
         frappe.throw(
             _("Marketing Asset {0} does not exist.").format(marketing_asset),
             frappe.DoesNotExistError,
         )
 
-    frappe.has_permission("IMS Marketing Asset", "read", marketing_asset, throw=True)
+    _check_asset_read(marketing_asset)
 
     filters = {"marketing_asset": marketing_asset}
     if revision_number:
@@ -800,7 +1312,6 @@ def get_annotations(marketing_asset: str, revision_number: int = None) -> dict:
             "name",
             "revision_number",
             "revision_file",
-            "annotations",
             "content_brief",
         ],
         order_by="revision_number DESC",
@@ -809,16 +1320,11 @@ def get_annotations(marketing_asset: str, revision_number: int = None) -> dict:
     revision_data = revision_list[0] if revision_list else None
 
     # Permission check for revision upload
-    can_upload = False
-    asset_status = frappe.db.get_value("IMS Marketing Asset", marketing_asset, "status")
-    if asset_status in ["Draft", "Rejected"]:
-        can_upload = True
+    can_upload = asset.status in ["Draft", "Rejected"]
 
     if not revision_data:
         # No revision yet — fall back to asset description
-        asset_desc = frappe.db.get_value(
-            "IMS Marketing Asset", marketing_asset, "description"
-        )
+        asset_desc = asset.description
         return {
             "status": "success",
             "annotations": [],
@@ -826,11 +1332,23 @@ def get_annotations(marketing_asset: str, revision_number: int = None) -> dict:
             "content_brief": asset_desc or "",
         }
 
-    annotations = json.loads(revision_data.get("annotations") or "[]")
+    annotations = _annotation_dicts(
+        revision_data.get("name"), int(offset), int(page_size)
+    )
+    total_annotations = len(annotations)
+    if page_size:
+        total_annotations = frappe.db.count(
+            "IMS Annotation",
+            filters={
+                "parent": revision_data.get("name"),
+                "parenttype": "IMS Asset Revision",
+            },
+        )
 
     return {
         "status": "success",
         "annotations": annotations,
+        "total_annotations": total_annotations,
         "revision": revision_data.get("name"),
         "revision_number": revision_data.get("revision_number"),
         "revision_file": revision_data.get("revision_file"),
@@ -839,20 +1357,39 @@ def get_annotations(marketing_asset: str, revision_number: int = None) -> dict:
     }
 
 
-@frappe.whitelist(allow_guest=False)
-def get_workflow_transitions(marketing_asset: str) -> dict:
-    """Get available workflow transitions for the current user and asset."""
-    if not frappe.db.exists("IMS Marketing Asset", marketing_asset):
-        return {"status": "error", "message": _("Asset not found")}
+WF_TRANSITIONS_CACHE_PREFIX = "ims:wf_transitions"
 
-    doc = frappe.get_doc("IMS Marketing Asset", marketing_asset)
 
-    # Get transitions directly from Frappe's workflow engine
-    from frappe.model.workflow import get_transitions
+def _roles_cache_key() -> str:
+    """Stable digest of the current user's role set for cache keying."""
+    return hashlib.md5(",".join(sorted(frappe.get_roles())).encode()).hexdigest()
+
+
+def clear_workflow_transitions_cache(doc=None, method=None):
+    """Workflow doc event: drop cached transitions when definitions change."""
+    frappe.cache().delete_keys(WF_TRANSITIONS_CACHE_PREFIX)
+
+
+# Action -> button style, resolved once per distinct action name. The
+# workflow vocabulary is tiny, so this memo stays a handful of entries.
+_ACTION_STYLE_CACHE: dict = {}
+
+
+def _action_style(action: str) -> str:
+    style = _ACTION_STYLE_CACHE.get(action)
+    if style is None:
+        if action.startswith(("Approve", "Submit")):
+            style = "primary"
+        elif action == "Reject":
+            style = "danger"
+        else:
+            style = "default"
+        _ACTION_STYLE_CACHE[action] = style
+    return style
 
-    transitions = get_transitions(doc)
 
-    # Map transitions to a cleaner format for frontend
+def _format_transitions(transitions) -> list:
+    """Map raw workflow transitions to the frontend action format."""
     actions = []
     for t in transitions:
         # Handle both object and dict access for robustness
@@ -870,14 +1407,51 @@ def get_workflow_transitions(marketing_asset: str) -> dict:
             {
                 "action": action,
                 "next_state": next_state,
-                "style": (
-                    "primary"
-                    if action.startswith("Approve") or action.startswith("Submit")
-                    else "danger" if action == "Reject" else "default"
-                ),
+                "style": _action_style(action),
             }
         )
 
+    return actions
+
+
+@frappe.whitelist(allow_guest=False)
+def get_workflow_transitions(marketing_asset: str) -> dict:
+    """Get available workflow transitions for the current user and asset.
+
+    The allowed transitions only depend on the workflow state and the
+    user's roles, so the mapped list is cached per (state, roles) pair
+    and the asset doc is only loaded on a cache miss.
+    """
+    asset = frappe.db.get_value(
+        "IMS Marketing Asset",
+        marketing_asset,
+        ["name", "workflow_state"],
+        as_dict=True,
+    )
+    if not asset:
+        return {"status": "error", "message": _("Asset not found")}
+
+    cache_key = (
+        f"{WF_TRANSITIONS_CACHE_PREFIX}:{asset.workflow_state}:{_roles_cache_key()}"
+    )
+    cached = frappe.cache().get_value(cache_key)
+    if cached is not None:
+        return {
+            "status": "success",
+            "current_state": asset.workflow_state,
+            "transitions": cached,
+        }
+
+    doc = frappe.get_doc("IMS Marketing Asset", marketing_asset)
+
+    # Get transitions directly from Frappe's workflow engine
+    from frappe.model.workflow import get_transitions
+
+    actions = _format_transitions(get_transitions(doc))
+    # TTL backstops the Workflow on_update invalidation in case a
+    # definition changes through a path that skips doc events
+    frappe.cache().set_value(cache_key, actions, expires_in_sec=300)
+
     return {
         "status": "success",
         "current_state": doc.workflow_state,
@@ -888,23 +1462,33 @@ def get_workflow_transitions(marketing_asset: str) -> dict:
 @frappe.whitelist(allow_guest=False)
 def apply_workflow_transition(marketing_asset: str, action: str) -> dict:
     """Apply a workflow action to the asset."""
-    if not frappe.db.exists("IMS Marketing Asset", marketing_asset):
+    # apply_workflow mutates and saves the document, so the full doc
+    # load is unavoidable here; the separate existence pre-check is not,
+    # since get_doc already raises for a missing name
+    try:
+        doc = frappe.get_doc("IMS Marketing Asset", marketing_asset)
+    except frappe.DoesNotExistError:
         return {"status": "error", "message": _("Asset not found")}
 
     try:
-        doc = frappe.get_doc("IMS Marketing Asset", marketing_asset)
-        from frappe.model.workflow import apply_workflow
+        from frappe.model.workflow import apply_workflow, get_transitions
 
         apply_workflow(doc, action)
         doc.save()
-        frappe.db.commit()
 
-        # Determine next transitions
-        next_transitions = get_workflow_transitions(marketing_asset)["transitions"]
+        # Determine next transitions from the already-loaded doc instead
+        # of re-running the exists check and doc fetch
+        next_transitions = _format_transitions(get_transitions(doc))
 
-        # Check for Final Approval state
+        # Check for Final Approval state; the export talks to external
+        # storage, so it runs from a worker after commit
         if doc.workflow_state in ["Approved", "Final Sign-off"]:
-            export_on_approval(doc)
+            frappe.enqueue(
+                "ims.api.export_on_approval_job",
+                queue="short",
+                enqueue_after_commit=True,
+                asset_name=doc.name,
+            )
 
         return {
             "status": "success",
@@ -917,6 +1501,11 @@ def apply_workflow_transition(marketing_asset: str, action: str) -> dict:
         return {"status": "error", "message": str(e)}
 
 
+def export_on_approval_job(asset_name: str):
+    """Background-job entry point for export_on_approval (takes a name)."""
+    export_on_approval(frappe.get_doc("IMS Marketing Asset", asset_name))
+
+
 def export_on_approval(asset_doc):
     """
     Handle export logic when asset is approved.
@@ -959,7 +1548,7 @@ def get_project_details(name: str) -> dict:
     if not frappe.db.exists("IMS Project", name):
         return {"status": "error", "message": _("Project not found")}
 
-    project = frappe.get_doc("IMS Project", name)
+    project = _get_doc_cached("IMS Project", name)
 
     # Get linked assets
     assets = frappe.db.get_list(
@@ -978,7 +1567,7 @@ def get_project_details(name: str) -> dict:
             "description": project.description,
             "due_date": project.due_date,
             "creation": project.creation,
-            "owner": frappe.utils.get_fullname(project.owner),
+            "owner": _fullname(project.owner),
         },
         "assets": assets,
     }
@@ -987,7 +1576,7 @@ def get_project_details(name: str) -> dict:
 @frappe.whitelist(allow_guest=False)
 def upload_revision(marketing_asset: str, notes: str = "") -> dict:
     """Upload a new file version for an existing asset."""
-    if not frappe.db.exists("IMS Marketing Asset", marketing_asset):
+    if not _asset_exists(marketing_asset):
         frappe.throw(_("Asset not found"), frappe.DoesNotExistError)
 
     # Check for file
@@ -1018,17 +1607,18 @@ def upload_revision(marketing_asset: str, notes: str = "") -> dict:
     file_doc = upload_file()
     file_url = file_doc.file_url
 
-    # Get latest revision (number + content_brief to carry forward)
-    prev_list = frappe.get_all(
+    # Get latest revision (number + content_brief to carry forward);
+    # get_value skips get_all's permission and list-settings machinery
+    # for what is a single indexed-row read
+    prev_revision = frappe.db.get_value(
         "IMS Asset Revision",
-        filters={"marketing_asset": marketing_asset},
-        fields=["revision_number", "content_brief"],
-        order_by="revision_number DESC",
-        limit=1,
+        {"marketing_asset": marketing_asset},
+        ["revision_number", "content_brief"],
+        order_by="revision_number desc",
+        as_dict=True,
     )
-    prev_revision = prev_list[0] if prev_list else None
-    latest_rev_num = prev_revision.get("revision_number") if prev_revision else 0
-    prev_content_brief = prev_revision.get("content_brief") if prev_revision else ""
+    latest_rev_num = prev_revision.revision_number if prev_revision else 0
+    prev_content_brief = prev_revision.content_brief if prev_revision else ""
 
     # Create new revision — carry forward content_brief from previous
     revision_doc = frappe.get_doc(
@@ -1043,14 +1633,19 @@ def upload_revision(marketing_asset: str, notes: str = "") -> dict:
             "content_brief": prev_content_brief or "",
         }
     )
+    # The set_value below covers latest_file, so the revision's own
+    # after_insert parent sync would be a second identical UPDATE
+    revision_doc.flags.skip_parent_sync = True
     revision_doc.insert(ignore_permissions=True)
 
-    # Update parent asset
-    asset = frappe.get_doc("IMS Marketing Asset", marketing_asset)
-    asset.latest_file = file_url
-    asset.description = prev_content_brief or ""
-    asset.save(ignore_permissions=True)
-    frappe.db.commit()
+    # Update parent asset: a two-column write, so skip the full doc
+    # load/validate/save cycle. Neither field feeds the workflow-state
+    # sync in on_update.
+    frappe.db.set_value(
+        "IMS Marketing Asset",
+        marketing_asset,
+        {"latest_file": file_url, "description": prev_content_brief or ""},
+    )
 
     return {
         "status": "success",
@@ -1060,6 +1655,144 @@ def upload_revision(marketing_asset: str, notes: str = "") -> dict:
     }
 
 
+_REVISION_INSERT_FIELDS = [
+    "name",
+    "owner",
+    "modified_by",
+    "creation",
+    "modified",
+    "marketing_asset",
+    "revision_number",
+    "revision_file",
+    "revision_notes",
+    "annotations",
+    "content_brief",
+]
+
+
+@frappe.whitelist(allow_guest=False)
+def upload_revisions(uploads) -> dict:
+    """Create revisions for several already-uploaded files in one batch.
+
+    Companion to upload_revision for frontends that add files in a loop:
+    `uploads` is a JSON list of {marketing_asset, file_url, notes}. The
+    next revision numbers come from one grouped query, all rows go in
+    via a single multi-row INSERT, and each distinct asset gets one
+    latest_file update — instead of a doc insert plus parent save per
+    file. Rows skip the doc lifecycle, so file_url values are checked
+    against tabFile up front and the files are forced private the same
+    way the revision controller's validate does.
+    """
+    if isinstance(uploads, str):
+        uploads = _loads(uploads)
+    if not uploads:
+        frappe.throw(_("No uploads provided"))
+
+    asset_names = {u.get("marketing_asset") for u in uploads}
+    if not all(asset_names):
+        frappe.throw(_("marketing_asset is required for every upload"))
+    if not all(u.get("file_url") for u in uploads):
+        frappe.throw(_("file_url is required for every upload"))
+
+    existing = {
+        row[0]
+        for row in frappe.db.sql(
+            "SELECT name FROM `tabIMS Marketing Asset` WHERE name IN %(names)s",
+            {"names": tuple(asset_names)},
+        )
+    }
+    missing = asset_names - existing
+    if missing:
+        frappe.throw(
+            _("Marketing Asset {0} does not exist.").format(", ".join(sorted(missing))),
+            frappe.DoesNotExistError,
+        )
+
+    # Every file_url must belong to an uploaded File; the batch path
+    # writes these straight into latest_file, so reject strays up front
+    file_urls = {u["file_url"] for u in uploads}
+    known_urls = {
+        row[0]
+        for row in frappe.db.sql(
+            "SELECT file_url FROM `tabFile` WHERE file_url IN %(urls)s",
+            {"urls": tuple(file_urls)},
+        )
+    }
+    unknown = file_urls - known_urls
+    if unknown:
+        frappe.throw(
+            _("No uploaded File found for {0}.").format(", ".join(sorted(unknown))),
+            frappe.DoesNotExistError,
+        )
+
+    # Next revision number per asset from one grouped query
+    next_rev = dict(
+        frappe.db.sql(
+            """
+            SELECT marketing_asset, MAX(revision_number)
+            FROM `tabIMS Asset Revision`
+            WHERE marketing_asset IN %(names)s
+            GROUP BY marketing_asset
+            """,
+            {"names": tuple(asset_names)},
+        )
+    )
+
+    from frappe.model.naming import make_autoname
+
+    now = frappe.utils.now()
+    user = frappe.session.user
+    values = []
+    created = []
+    latest_file = {}
+
+    for upload in uploads:
+        asset_name = upload["marketing_asset"]
+        rev_number = (next_rev.get(asset_name) or 0) + 1
+        next_rev[asset_name] = rev_number
+        latest_file[asset_name] = upload["file_url"]
+
+        values.append(
+            (
+                # Same series the doctype autonames with, so batch rows
+                # are indistinguishable from doc-inserted ones
+                make_autoname("IMS-REV-.YYYY.-.#####."),
+                user,
+                user,
+                now,
+                now,
+                asset_name,
+                rev_number,
+                upload["file_url"],
+                upload.get("notes") or "",
+                "[]",
+                upload.get("content_brief") or "",
+            )
+        )
+        created.append({"marketing_asset": asset_name, "revision": rev_number})
+
+    frappe.db.bulk_insert("IMS Asset Revision", _REVISION_INSERT_FIELDS, values)
+
+    # bulk_insert skips the doc lifecycle, so apply the privacy
+    # invariant ensure_file_is_private enforces on the single path:
+    # revision files stay private until approval
+    frappe.db.sql(
+        "UPDATE `tabFile` SET is_private = 1"
+        " WHERE file_url IN %(urls)s AND is_private = 0",
+        {"urls": tuple(file_urls)},
+    )
+
+    # One parent update per distinct asset, pointing at its last file
+    for asset_name, file_url in latest_file.items():
+        frappe.db.set_value("IMS Marketing Asset", asset_name, "latest_file", file_url)
+
+    return {
+        "status": "success",
+        "message": _("{0} revisions created.").format(len(values)),
+        "revisions": created,
+    }
+
+
 @frappe.whitelist(allow_guest=False)
 def save_content_brief(
     marketing_asset: str = None, revision_name: str = None, content_brief: str = ""
@@ -1078,7 +1811,7 @@ def save_content_brief(
 
     if not revision_name:
         # Create revision if missing
-        asset_doc = frappe.get_doc("IMS Marketing Asset", marketing_asset)
+        asset_doc = _get_doc_cached("IMS Marketing Asset", marketing_asset)
         if not asset_doc.latest_file:
             frappe.throw(_("No file associated with this asset."))
 
@@ -1093,7 +1826,6 @@ def save_content_brief(
             }
         )
         rev.insert(ignore_permissions=True)
-        frappe.db.commit()
         return {
             "status": "success",
             "message": _("Content brief saved in new revision."),
@@ -1107,14 +1839,20 @@ def save_content_brief(
         )
 
     # Permission check via parent asset
-    frappe.has_permission("IMS Marketing Asset", "read", marketing_asset, throw=True)
+    _check_asset_read(marketing_asset)
 
-    # Fetch doc
+    # A plain field write doesn't need the full doc; two columns decide
+    # which branch runs and only the Revision-2 creation loads a doc
     try:
-        rev_doc = frappe.get_doc("IMS Asset Revision", revision_name)
+        rev_row = frappe.db.get_value(
+            "IMS Asset Revision",
+            revision_name,
+            ["revision_number", "revision_file"],
+            as_dict=True,
+        )
 
         # Protection: Never overwrite Revision 1
-        if rev_doc.revision_number == 1:
+        if rev_row.revision_number == 1:
             # Try to find Revision 2 or create it
             rev2_name = frappe.db.get_value(
                 "IMS Asset Revision",
@@ -1128,31 +1866,32 @@ def save_content_brief(
                         "doctype": "IMS Asset Revision",
                         "marketing_asset": marketing_asset,
                         "revision_number": 2,
-                        "revision_file": rev_doc.revision_file,
-                        "annotations": rev_doc.annotations,
+                        "revision_file": rev_row.revision_file,
+                        "annotation_rows": _get_annotation_rows(revision_name),
                         "content_brief": content_brief,
                         "revision_notes": "Modified text version.",
                     }
                 )
                 new_rev.insert(ignore_permissions=True)
-                rev_doc = new_rev
                 revision_name = new_rev.name
             else:
                 # Update existing Revision 2 instead
-                rev_doc = frappe.get_doc("IMS Asset Revision", rev2_name)
-                rev_doc.content_brief = content_brief
-                rev_doc.save(ignore_permissions=True)
+                frappe.db.set_value(
+                    "IMS Asset Revision", rev2_name, "content_brief", content_brief
+                )
                 revision_name = rev2_name
         else:
             # Normal update for Revision 2+
-            rev_doc.content_brief = content_brief
-            rev_doc.save(ignore_permissions=True)
-
-        # Sync back to parent Asset
-        asset_doc = frappe.get_doc("IMS Marketing Asset", marketing_asset)
-        asset_doc.description = content_brief
-        asset_doc.save(ignore_permissions=True)
-        frappe.db.commit()
+            frappe.db.set_value(
+                "IMS Asset Revision", revision_name, "content_brief", content_brief
+            )
+
+        # Sync back to parent Asset; a direct column write skips the
+        # full doc load and validate pass, neither of which depends on
+        # the description
+        frappe.db.set_value(
+            "IMS Marketing Asset", marketing_asset, "description", content_brief
+        )
     except Exception as e:
         frappe.log_error(frappe.get_traceback(), _("Content Brief Save Error"))
         return {"status": "error", "message": str(e)}
@@ -1173,18 +1912,19 @@ def update_content_brief(revision_name: str, content_brief: str = "") -> dict:
 @frappe.whitelist(allow_guest=False)
 def fix_all_files():
     """Diagnostic: Make all IMS Asset Revision files public."""
-    files = frappe.get_all(
-        "File",
-        filters={"attached_to_doctype": "IMS Asset Revision", "is_private": 1},
-        fields=["name", "file_url"],
+    # Whole fix as one set-based UPDATE: no candidate SELECT, no Python
+    # loop. SUBSTRING(file_url, 9) strips the 8-char '/private' prefix,
+    # keeping the leading slash.
+    frappe.db.sql(
+        """
+        UPDATE `tabFile`
+        SET is_private = 0,
+            file_url = SUBSTRING(file_url, 9)
+        WHERE attached_to_doctype = 'IMS Asset Revision'
+          AND is_private = 1
+          AND file_url LIKE '/private/%%'
+        """
     )
+    count = frappe.db.sql("SELECT ROW_COUNT()")[0][0]
 
-    count = 0
-    for f in files:
-        if f.file_url.startswith("/private/"):
-            new_url = f.file_url.replace("/private/", "/")
-            frappe.db.set_value("File", f.name, {"is_private": 0, "file_url": new_url})
-            count += 1
-
-    frappe.db.commit()
     return {"status": "success", "message": f"Fixed {count} files."}
@@ -177,13 +177,18 @@ add_to_apps_screen = [
 # ---------------
 # Hook on document methods and events
 
-# doc_events = {
-# 	"*": {
-# 		"on_update": "method",
-# 		"on_cancel": "method",
-# 		"on_trash": "method"
-# 	}
-# }
+doc_events = {
+    "File": {
+        "after_insert": "ims.api.on_file_after_insert",
+        "after_delete": "ims.api.on_file_after_delete",
+    },
+    "Workflow": {
+        "on_update": "ims.api.clear_workflow_transitions_cache",
+    },
+    "Notification Log": {
+        "after_insert": "ims.api.on_notification_after_insert",
+    },
+}
 
 # Scheduled Tasks
 # ---------------
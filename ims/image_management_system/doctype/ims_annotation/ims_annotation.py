@@ -0,0 +1,15 @@
+# Copyright (c) 2026, surendhranath and contributors
+# For license information, please see license.txt
+
+from frappe.model.document import Document
+
+
+class IMSAnnotation(Document):
+    """Child row of IMS Asset Revision holding a single annotation.
+
+    One row per annotation makes a submit a single INSERT and a fetch an
+    indexed SELECT, instead of rewriting the whole JSON blob that the
+    revision's legacy `annotations` field stored.
+    """
+
+    pass
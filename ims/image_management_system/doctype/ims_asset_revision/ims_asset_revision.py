@@ -6,6 +6,13 @@ import json
 import frappe
 from frappe.model.document import Document
 
+# Annotation payloads can run to megabytes for complex canvases; parse
+# them with orjson's C decoder when available, stdlib json otherwise
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
 
 class IMSAssetRevision(Document):
     """Controller for IMS Asset Revision.
@@ -28,26 +35,36 @@ class IMSAssetRevision(Document):
         if not self.marketing_asset:
             return
 
-        max_rev = frappe.db.get_value(
+        # Backward walk of the (marketing_asset, revision_number) index
+        # returns the top revision in one row; MAX() aggregated the
+        # whole group per insert
+        last_rev = frappe.db.get_value(
             "IMS Asset Revision",
             {"marketing_asset": self.marketing_asset},
-            "MAX(revision_number)",
+            "revision_number",
+            order_by="revision_number desc",
         )
-        self.revision_number = (max_rev or 0) + 1
+        self.revision_number = (last_rev or 0) + 1
 
     def initialize_annotations(self):
         """Initialize annotations as an empty JSON array if not set."""
         if not self.annotations:
-            self.annotations = json.dumps([])
+            self.annotations = "[]"
 
     def validate_annotations_format(self):
         """Ensure the annotations field contains valid JSON array."""
+        # Saves that don't touch annotations (status flips, brief edits)
+        # would otherwise re-parse a payload that was validated when it
+        # was last written
+        if not self.is_new() and not self.has_value_changed("annotations"):
+            return
+
         if not self.annotations:
-            self.annotations = json.dumps([])
+            self.annotations = "[]"
             return
 
         try:
-            data = json.loads(self.annotations)
+            data = _loads(self.annotations)
             if not isinstance(data, list):
                 frappe.throw("Annotations must be a JSON array.")
         except (json.JSONDecodeError, TypeError):
@@ -58,19 +75,24 @@ class IMSAssetRevision(Document):
         if not self.revision_file:
             return
 
-        file_doc = frappe.db.get_value(
-            "File",
-            {"file_url": self.revision_file},
-            ["name", "is_private"],
-            as_dict=True,
+        # One conditional UPDATE instead of SELECT-then-UPDATE; the
+        # is_private=0 predicate makes it a no-op when already private
+        frappe.db.sql(
+            "UPDATE `tabFile` SET is_private = 1"
+            " WHERE file_url = %s AND is_private = 0",
+            (self.revision_file,),
         )
 
-        if file_doc and not file_doc.is_private:
-            frappe.db.set_value("File", file_doc.name, "is_private", 1)
-
     def after_insert(self):
         """Update the parent marketing asset's latest_file to point
-        to this revision's file."""
+        to this revision's file.
+
+        Callers that update the parent themselves in the same request
+        set flags.skip_parent_sync to avoid a duplicate write.
+        """
+        if self.flags.skip_parent_sync:
+            return
+
         if self.marketing_asset and self.revision_file:
             frappe.db.set_value(
                 "IMS Marketing Asset",
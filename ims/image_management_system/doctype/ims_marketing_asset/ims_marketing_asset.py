@@ -18,24 +18,50 @@ class IMSMarketingAsset(Document):
     def ensure_file_is_private(self):
         """Ensure the attached file is marked as private (is_private=1)
         until the asset reaches Approved state."""
-        if not self.latest_file:
+        if not self.latest_file or self.status == "Approved":
             return
 
-        file_doc = frappe.db.get_value(
-            "File",
-            {"file_url": self.latest_file},
-            ["name", "is_private"],
-            as_dict=True,
+        # One conditional UPDATE instead of SELECT-then-UPDATE; the
+        # is_private=0 predicate makes it a no-op when already private
+        frappe.db.sql(
+            "UPDATE `tabFile` SET is_private = 1"
+            " WHERE file_url = %s AND is_private = 0",
+            (self.latest_file,),
         )
 
-        if file_doc and not file_doc.is_private and self.status != "Approved":
-            frappe.db.set_value("File", file_doc.name, "is_private", 1)
-
     def on_update(self):
-        """Sync the status field with the workflow_state when it changes."""
-        workflow_state = getattr(self, "workflow_state", None)
-        if workflow_state and self.status != workflow_state:
-            self.db_set("status", workflow_state)
+        """Sync the status field with the workflow_state when it changes.
+
+        Each side effect runs only when a field it depends on actually
+        changed, so saves that touch e.g. only the description skip the
+        sync, the summary-cache flush and the uploads-MV rebuild.
+        """
+        from ims.api import clear_dashboard_summary_cache, refresh_recent_uploads_mv
+
+        if self.has_value_changed("workflow_state") or self.has_value_changed(
+            "status"
+        ):
+            workflow_state = getattr(self, "workflow_state", None)
+            if workflow_state and self.status != workflow_state:
+                self.db_set("status", workflow_state)
+
+            # The dashboard summary only aggregates per-status counts
+            clear_dashboard_summary_cache()
+
+        # The MV carries asset_title; file-level rows are maintained by
+        # the File after_insert hook
+        if self.has_value_changed("asset_title"):
+            refresh_recent_uploads_mv(self.name)
+
+    def on_trash(self):
+        """Invalidate the cached dashboard summary when an asset is deleted."""
+        from ims.api import clear_dashboard_summary_cache
+
+        clear_dashboard_summary_cache()
+        frappe.db.sql(
+            "DELETE FROM `ims_recent_uploads_mv` WHERE asset_name = %s",
+            (self.name,),
+        )
 
     def after_insert(self):
         """Create initial revision (Revision 1) automatically on creation."""
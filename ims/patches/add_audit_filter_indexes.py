@@ -0,0 +1,24 @@
+import frappe
+
+
+def execute():
+    """Widen the audit/notification indexes to cover the filter columns.
+
+    The earlier (reference_doctype, creation) and (for_user, creation)
+    indexes serve the ordered scans, but the feed queries also filter on
+    comment_type and the unread count on `read`; these composites let
+    those run fully from the index.
+    """
+    frappe.db.add_index(
+        "Comment",
+        ["reference_doctype", "comment_type", "creation"],
+        index_name="ims_comment_ref_type_creation",
+    )
+    # add_index interpolates the field list unquoted and READ is a
+    # reserved word, so it has to be backtick-quoted here
+    frappe.db.add_index(
+        "Notification Log",
+        ["for_user", "`read`", "creation"],
+        index_name="ims_notif_user_read_creation",
+    )
+    frappe.db.commit()
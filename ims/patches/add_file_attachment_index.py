@@ -0,0 +1,16 @@
+import frappe
+
+
+def execute():
+    """Index (attached_to_doctype, attached_to_name) on tabFile.
+
+    The ims_recent_uploads_mv refresh and backfill both filter tabFile
+    by attached_to_doctype and attached_to_name; this index keeps those
+    maintenance queries off the full file table.
+    """
+    frappe.db.add_index(
+        "File",
+        ["attached_to_doctype", "attached_to_name"],
+        index_name="ims_file_attachment",
+    )
+    frappe.db.commit()
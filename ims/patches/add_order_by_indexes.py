@@ -0,0 +1,26 @@
+import frappe
+
+
+def execute():
+    """Align ORDER BY columns of the hot list queries with indexes.
+
+    search_assets orders by modified and the notification feed scans
+    tabNotification Log per user by creation; without matching indexes
+    MySQL filesorts the filtered set on every call.
+    """
+    frappe.db.add_index(
+        "IMS Marketing Asset",
+        ["modified"],
+        index_name="ims_asset_modified",
+    )
+    frappe.db.add_index(
+        "IMS Project",
+        ["modified"],
+        index_name="ims_project_modified",
+    )
+    frappe.db.add_index(
+        "Notification Log",
+        ["for_user", "creation"],
+        index_name="ims_notif_user_creation",
+    )
+    frappe.db.commit()
@@ -0,0 +1,26 @@
+import frappe
+
+
+def execute():
+    """Add composite indexes for the revision and audit-log hot lookups.
+
+    The latest-revision lookup (WHERE marketing_asset=? ORDER BY
+    revision_number DESC LIMIT 1) and the audit/notification range scans
+    were filter+filesort without these; each becomes an index walk.
+    """
+    frappe.db.add_index(
+        "IMS Asset Revision",
+        ["marketing_asset", "revision_number"],
+        index_name="ims_rev_lookup",
+    )
+    frappe.db.add_index(
+        "Comment",
+        ["reference_doctype", "creation"],
+        index_name="ims_comment_ref_creation",
+    )
+    frappe.db.add_index(
+        "Version",
+        ["ref_doctype", "creation"],
+        index_name="ims_version_ref_creation",
+    )
+    frappe.db.commit()
@@ -0,0 +1,29 @@
+import frappe
+
+
+def execute():
+    """Add FULLTEXT indexes for the command-palette search queries.
+
+    Leading-wildcard LIKE scans in search_assets/search_projects cannot
+    use B-tree indexes; MATCH ... AGAINST on these inverted indexes is
+    O(matches) instead of O(rows).
+    """
+    _add_fulltext_index(
+        "tabIMS Marketing Asset", "ims_search_ft", ["asset_title", "name", "campaign"]
+    )
+    _add_fulltext_index(
+        "tabIMS Project", "ims_search_ft", ["project_title", "name", "description"]
+    )
+    frappe.db.commit()
+
+
+def _add_fulltext_index(table: str, index_name: str, columns: list):
+    existing = frappe.db.sql(
+        f"SHOW INDEX FROM `{table}` WHERE Key_name = %s", (index_name,)
+    )
+    if existing:
+        return
+
+    cols = ", ".join(f"`{c}`" for c in columns)
+    frappe.db.sql_ddl(f"ALTER TABLE `{table}` ADD FULLTEXT `{index_name}` ({cols})")
+    print(f"Added FULLTEXT index {index_name} on {table}")
@@ -0,0 +1,21 @@
+import frappe
+
+
+def execute():
+    """Add composite indexes for the status-filtered asset listings.
+
+    get_recent_assets filters by status and orders by creation, and
+    get_project_details lists a project's assets by modified; without
+    matching composite indexes both filesort the filtered set.
+    """
+    frappe.db.add_index(
+        "IMS Marketing Asset",
+        ["status", "creation"],
+        index_name="ims_asset_status_creation",
+    )
+    frappe.db.add_index(
+        "IMS Marketing Asset",
+        ["project", "modified"],
+        index_name="ims_asset_project_modified",
+    )
+    frappe.db.commit()
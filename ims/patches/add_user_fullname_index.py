@@ -0,0 +1,15 @@
+import frappe
+
+
+def execute():
+    """Index (enabled, full_name) on tabUser for the mention autocomplete.
+
+    get_users_for_mention now prefix-matches full_name per keystroke;
+    this index turns the filtered scan into a range seek.
+    """
+    frappe.db.add_index(
+        "User",
+        ["enabled", "full_name"],
+        index_name="ims_user_enabled_fullname",
+    )
+    frappe.db.commit()
@@ -0,0 +1,49 @@
+import frappe
+
+
+def execute():
+    """Create and backfill the recent-uploads summary table.
+
+    `get_recent_uploads` joined tabFile to tabIMS Marketing Asset on an
+    unindexed file_url string equality on every dashboard load. The
+    pre-joined rows now live in `ims_recent_uploads_mv`, maintained from
+    File/asset write hooks, so the dashboard read is an indexed scan.
+    """
+    frappe.db.sql_ddl(
+        """
+        CREATE TABLE IF NOT EXISTS `ims_recent_uploads_mv` (
+            `file_name` varchar(140) NOT NULL,
+            `display_name` varchar(140),
+            `file_url` varchar(255),
+            `file_size` bigint,
+            `creation` datetime(6),
+            `asset_name` varchar(140),
+            `asset_title` varchar(140),
+            PRIMARY KEY (`file_name`),
+            KEY `idx_creation` (`creation`),
+            KEY `idx_asset_name` (`asset_name`)
+        ) ENGINE=InnoDB
+        """
+    )
+
+    # Backfill from the join the dashboard used to run per request
+    frappe.db.sql("DELETE FROM `ims_recent_uploads_mv`")
+    frappe.db.sql(
+        """
+        INSERT INTO `ims_recent_uploads_mv`
+            (file_name, display_name, file_url, file_size, creation, asset_name, asset_title)
+        SELECT
+            f.name,
+            f.file_name,
+            f.file_url,
+            f.file_size,
+            f.creation,
+            a.name,
+            a.asset_title
+        FROM `tabFile` f
+        LEFT JOIN `tabIMS Marketing Asset` a ON f.attached_to_name = a.name
+        WHERE f.attached_to_doctype = 'IMS Marketing Asset'
+        ON DUPLICATE KEY UPDATE asset_name = VALUES(asset_name)
+        """
+    )
+    frappe.db.commit()
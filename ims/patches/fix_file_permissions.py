@@ -1,36 +1,62 @@
 import frappe
 
 
+def _files_by_url(urls):
+    """One File fetch for all private-flagged URLs, grouped by file_url.
+
+    Filtering is_private in SQL keeps already-public rows (usually the
+    vast majority on re-runs) out of the result set entirely.
+    """
+    if not urls:
+        return {}
+
+    by_url = {}
+    files = frappe.get_all(
+        "File",
+        filters={"file_url": ["in", urls], "is_private": 1},
+        fields=["name", "file_url"],
+    )
+    for f in files:
+        by_url.setdefault(f.file_url, []).append(f)
+    return by_url
+
+
 def execute():
     print("Starting permission fix...")
 
-    # 1. Fix Marketing Assets (latest_file)
+    names = set()
+
     assets = frappe.get_all("IMS Marketing Asset", fields=["name", "latest_file"])
+    revisions = frappe.get_all("IMS Asset Revision", fields=["name", "revision_file"])
+
+    # An asset's latest_file usually equals its newest revision's
+    # revision_file; one lookup over the combined URL set avoids
+    # fetching those shared File rows twice
+    files_by_url = _files_by_url(
+        list(
+            {a.latest_file for a in assets if a.latest_file}
+            | {r.revision_file for r in revisions if r.revision_file}
+        )
+    )
+
+    # 1. Fix Marketing Assets (latest_file)
     for asset in assets:
-        if asset.latest_file:
-            file_docs = frappe.get_all(
-                "File",
-                filters={"file_url": asset.latest_file},
-                fields=["name", "is_private"],
-            )
-            for f in file_docs:
-                if f.is_private:
-                    frappe.db.set_value("File", f.name, "is_private", 0)
-                    print(f"Made public: {asset.latest_file} (Asset: {asset.name})")
+        for f in files_by_url.get(asset.latest_file, []):
+            names.add(f.name)
+            print(f"Making public: {asset.latest_file} (Asset: {asset.name})")
 
     # 2. Fix Revisions (revision_file)
-    revisions = frappe.get_all("IMS Asset Revision", fields=["name", "revision_file"])
     for rev in revisions:
-        if rev.revision_file:
-            file_docs = frappe.get_all(
-                "File",
-                filters={"file_url": rev.revision_file},
-                fields=["name", "is_private"],
-            )
-            for f in file_docs:
-                if f.is_private:
-                    frappe.db.set_value("File", f.name, "is_private", 0)
-                    print(f"Made public: {rev.revision_file} (Revision: {rev.name})")
+        for f in files_by_url.get(rev.revision_file, []):
+            names.add(f.name)
+            print(f"Making public: {rev.revision_file} (Revision: {rev.name})")
+
+    # One UPDATE for every collected row instead of a set_value each
+    if names:
+        frappe.db.sql(
+            "UPDATE `tabFile` SET is_private = 0 WHERE name IN %(names)s",
+            {"names": tuple(names)},
+        )
 
     frappe.db.commit()
     print("Permission fix completed.")
@@ -1,79 +1,108 @@
 import frappe
 
+from ims.patches.fix_file_permissions import _files_by_url
+
 
 def execute():
     print("Starting robust permission fix...")
 
-    # 1. Fix Marketing Assets (latest_file)
     assets = frappe.get_all("IMS Marketing Asset", fields=["name", "latest_file"])
+    revisions = frappe.get_all("IMS Asset Revision", fields=["name", "revision_file"])
+
+    # An asset's latest_file usually equals its newest revision's
+    # revision_file; one lookup over the combined URL set avoids
+    # fetching those shared File rows twice
+    files_by_url = _files_by_url(
+        list(
+            {a.latest_file for a in assets if a.latest_file}
+            | {r.revision_file for r in revisions if r.revision_file}
+        )
+    )
+
+    # File rows reachable from both an asset and a revision only need
+    # the flip/move once; maps File name -> final URL so the revision
+    # pass can still fix its own parent link
+    flipped = {}
+
+    # 1. Fix Marketing Assets (latest_file)
     for asset in assets:
-        if asset.latest_file:
-            # Find the File document(s) associated with this URL
-            file_docs = frappe.get_all(
-                "File",
-                filters={"file_url": asset.latest_file},
-                fields=["name", "is_private", "file_url"],
-            )
-            for f_data in file_docs:
-                if f_data.is_private:
-                    try:
-                        file_doc = frappe.get_doc("File", f_data.name)
-                        file_doc.is_private = 0
-                        file_doc.save(ignore_permissions=True)
-                        frappe.db.commit()
-                        print(
-                            f"Moved to public: {f_data.file_url} -> {file_doc.file_url} (Asset: {asset.name})"
-                        )
+        for f_data in files_by_url.get(asset.latest_file, []):
+            try:
+                # The full doc save is only needed when the flip has
+                # to physically relocate the file (File.on_update);
+                # rows without a /private/ URL are a pure column flip
+                if not f_data.file_url.startswith("/private/"):
+                    frappe.db.set_value("File", f_data.name, "is_private", 0)
+                    flipped[f_data.name] = f_data.file_url
+                    print(f"Made public in place: {f_data.file_url}")
+                    continue
+
+                file_doc = frappe.get_doc("File", f_data.name)
+                file_doc.is_private = 0
+                file_doc.save(ignore_permissions=True)
+                flipped[f_data.name] = file_doc.file_url
+                print(
+                    f"Moved to public: {f_data.file_url} -> {file_doc.file_url} (Asset: {asset.name})"
+                )
 
-                        # Update asset if URL changed
-                        if file_doc.file_url != asset.latest_file:
-                            frappe.db.set_value(
-                                "IMS Marketing Asset",
-                                asset.name,
-                                "latest_file",
-                                file_doc.file_url,
-                            )
-                            print(
-                                f"Updated Asset {asset.name} latest_file to {file_doc.file_url}"
-                            )
-
-                    except Exception as e:
-                        print(f"Error processing file {f_data.name}: {e}")
+                # Update asset if URL changed
+                if file_doc.file_url != asset.latest_file:
+                    frappe.db.set_value(
+                        "IMS Marketing Asset",
+                        asset.name,
+                        "latest_file",
+                        file_doc.file_url,
+                    )
+                    print(
+                        f"Updated Asset {asset.name} latest_file to {file_doc.file_url}"
+                    )
+
+            except Exception as e:
+                print(f"Error processing file {f_data.name}: {e}")
 
     # 2. Fix Revisions (revision_file)
-    revisions = frappe.get_all("IMS Asset Revision", fields=["name", "revision_file"])
     for rev in revisions:
-        if rev.revision_file:
-            file_docs = frappe.get_all(
-                "File",
-                filters={"file_url": rev.revision_file},
-                fields=["name", "is_private", "file_url"],
-            )
-            for f_data in file_docs:
-                if f_data.is_private:
-                    try:
-                        file_doc = frappe.get_doc("File", f_data.name)
-                        file_doc.is_private = 0
-                        file_doc.save(ignore_permissions=True)
-                        frappe.db.commit()
+        for f_data in files_by_url.get(rev.revision_file, []):
+            try:
+                if f_data.name in flipped:
+                    new_url = flipped[f_data.name]
+                    if new_url != rev.revision_file:
+                        frappe.db.set_value(
+                            "IMS Asset Revision", rev.name, "revision_file", new_url
+                        )
                         print(
-                            f"Moved to public: {f_data.file_url} -> {file_doc.file_url} (Revision: {rev.name})"
+                            f"Updated Revision {rev.name} revision_file to {new_url}"
                         )
+                    continue
+
+                if not f_data.file_url.startswith("/private/"):
+                    frappe.db.set_value("File", f_data.name, "is_private", 0)
+                    flipped[f_data.name] = f_data.file_url
+                    print(f"Made public in place: {f_data.file_url}")
+                    continue
+
+                file_doc = frappe.get_doc("File", f_data.name)
+                file_doc.is_private = 0
+                file_doc.save(ignore_permissions=True)
+                flipped[f_data.name] = file_doc.file_url
+                print(
+                    f"Moved to public: {f_data.file_url} -> {file_doc.file_url} (Revision: {rev.name})"
+                )
+
+                # Update revision if URL changed
+                if file_doc.file_url != rev.revision_file:
+                    frappe.db.set_value(
+                        "IMS Asset Revision",
+                        rev.name,
+                        "revision_file",
+                        file_doc.file_url,
+                    )
+                    print(
+                        f"Updated Revision {rev.name} revision_file to {file_doc.file_url}"
+                    )
 
-                        # Update revision if URL changed
-                        if file_doc.file_url != rev.revision_file:
-                            frappe.db.set_value(
-                                "IMS Asset Revision",
-                                rev.name,
-                                "revision_file",
-                                file_doc.file_url,
-                            )
-                            print(
-                                f"Updated Revision {rev.name} revision_file to {file_doc.file_url}"
-                            )
-
-                    except Exception as e:
-                        print(f"Error processing file {f_data.name}: {e}")
+            except Exception as e:
+                print(f"Error processing file {f_data.name}: {e}")
 
     frappe.db.commit()
     print("Robust permission fix completed.")
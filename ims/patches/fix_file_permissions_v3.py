@@ -1,6 +1,27 @@
 import frappe
 import os
-import shutil
+
+# One round-trip brings back every private asset/revision URL together
+# with its File row (NULL fname when no File doc matches)
+_SQL_PRIVATE_FILES = """
+    SELECT
+        'IMS Marketing Asset' AS dt,
+        a.name AS parent,
+        a.latest_file AS url,
+        f.name AS fname
+    FROM `tabIMS Marketing Asset` a
+    LEFT JOIN `tabFile` f ON f.file_url = a.latest_file
+    WHERE a.latest_file LIKE '/private/files/%'
+    UNION ALL
+    SELECT
+        'IMS Asset Revision' AS dt,
+        r.name AS parent,
+        r.revision_file AS url,
+        f.name AS fname
+    FROM `tabIMS Asset Revision` r
+    LEFT JOIN `tabFile` f ON f.file_url = r.revision_file
+    WHERE r.revision_file LIKE '/private/files/%'
+"""
 
 
 def execute():
@@ -10,73 +31,80 @@ def execute():
     public_files_path = os.path.join(site_path, "public", "files")
     private_files_path = os.path.join(site_path, "private", "files")
 
-    # 1. Fix Marketing Assets
-    assets = frappe.get_all("IMS Marketing Asset", fields=["name", "latest_file"])
-    for asset in assets:
-        if asset.latest_file and asset.latest_file.startswith("/private/files/"):
-            file_name = asset.latest_file.split("/")[-1]
-            public_url = f"/files/{file_name}"
-
-            # Move file on disk
-            private_path = os.path.join(private_files_path, file_name)
-            public_path = os.path.join(public_files_path, file_name)
-
-            if os.path.exists(private_path):
-                if not os.path.exists(public_path):
-                    shutil.move(private_path, public_path)
-                    print(f"Moved file on disk: {private_path} -> {public_path}")
-                else:
-                    print(f"File already exists in public: {public_path}")
+    # One scandir each instead of an os.path.exists stat pair per file
+    private_names = (
+        {e.name for e in os.scandir(private_files_path)}
+        if os.path.isdir(private_files_path)
+        else set()
+    )
+    public_names = (
+        {e.name for e in os.scandir(public_files_path)}
+        if os.path.isdir(public_files_path)
+        else set()
+    )
 
-            # Update Asset Doc
-            frappe.db.set_value(
-                "IMS Marketing Asset", asset.name, "latest_file", public_url
-            )
-            print(
-                f"Updated Asset {asset.name} URL: {asset.latest_file} -> {public_url}"
-            )
+    def move_to_public(file_name):
+        private_path = os.path.join(private_files_path, file_name)
+        public_path = os.path.join(public_files_path, file_name)
 
-            # Update File Doc(s)
-            file_docs = frappe.get_all("File", filters={"file_url": asset.latest_file})
-            for f in file_docs:
-                frappe.db.set_value(
-                    "File", f.name, {"file_url": public_url, "is_private": 0}
-                )
-                print(f"Updated File Doc {f.name} to public URL")
+        if file_name in private_names:
+            if file_name not in public_names:
+                # Both directories live under the site's files mount, so
+                # rename is a single inode move, not a copy+unlink
+                os.rename(private_path, public_path)
+                private_names.discard(file_name)
+                public_names.add(file_name)
+                print(f"Moved file on disk: {private_path} -> {public_path}")
+            else:
+                print(f"File already exists in public: {public_path}")
 
-    # 2. Fix Revisions
-    revisions = frappe.get_all("IMS Asset Revision", fields=["name", "revision_file"])
-    for rev in revisions:
-        if rev.revision_file and rev.revision_file.startswith("/private/files/"):
-            file_name = rev.revision_file.split("/")[-1]
-            public_url = f"/files/{file_name}"
+    rows = frappe.db.sql(_SQL_PRIVATE_FILES, as_dict=True)
 
-            # Move file on disk
-            private_path = os.path.join(private_files_path, file_name)
-            public_path = os.path.join(public_files_path, file_name)
+    asset_names = set()
+    rev_names = set()
+    file_names = []
 
-            if os.path.exists(private_path):
-                if not os.path.exists(public_path):
-                    shutil.move(private_path, public_path)
-                    print(f"Moved file on disk: {private_path} -> {public_path}")
-                else:
-                    print(f"File already exists in public: {public_path}")
+    for row in rows:
+        move_to_public(row.url.split("/")[-1])
 
-            # Update Revision Doc
-            frappe.db.set_value(
-                "IMS Asset Revision", rev.name, "revision_file", public_url
-            )
-            print(
-                f"Updated Revision {rev.name} URL: {rev.revision_file} -> {public_url}"
-            )
+        if row.dt == "IMS Marketing Asset":
+            asset_names.add(row.parent)
+        else:
+            rev_names.add(row.parent)
+        if row.fname:
+            file_names.append(row.fname)
+        print(f"Updating {row.dt} {row.parent} URL: {row.url}")
 
-            # Update File Doc(s)
-            file_docs = frappe.get_all("File", filters={"file_url": rev.revision_file})
-            for f in file_docs:
-                frappe.db.set_value(
-                    "File", f.name, {"file_url": public_url, "is_private": 0}
-                )
-                print(f"Updated File Doc {f.name} to public URL")
+    # The public URL is derived from the private one, so one UPDATE per
+    # table rewrites every affected row instead of a set_value per doc
+    if asset_names:
+        frappe.db.sql(
+            """
+            UPDATE `tabIMS Marketing Asset`
+            SET latest_file = CONCAT('/files/', SUBSTRING_INDEX(latest_file, '/', -1))
+            WHERE name IN %(names)s
+            """,
+            {"names": tuple(asset_names)},
+        )
+    if rev_names:
+        frappe.db.sql(
+            """
+            UPDATE `tabIMS Asset Revision`
+            SET revision_file = CONCAT('/files/', SUBSTRING_INDEX(revision_file, '/', -1))
+            WHERE name IN %(names)s
+            """,
+            {"names": tuple(rev_names)},
+        )
+    if file_names:
+        frappe.db.sql(
+            """
+            UPDATE `tabFile`
+            SET is_private = 0,
+                file_url = CONCAT('/files/', SUBSTRING_INDEX(file_url, '/', -1))
+            WHERE name IN %(names)s
+            """,
+            {"names": tuple(file_names)},
+        )
 
     frappe.db.commit()
     print("Aggressive fix completed.")
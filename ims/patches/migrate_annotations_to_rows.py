@@ -0,0 +1,70 @@
+import json
+
+import frappe
+
+
+def execute():
+    """Explode legacy annotation JSON blobs into IMS Annotation rows.
+
+    Annotations used to live as one JSON array per revision, rewritten
+    wholesale on every submit. They are now child rows of IMS Asset
+    Revision; this one-shot migration converts existing data.
+    """
+    revisions = frappe.get_all("IMS Asset Revision", fields=["name", "annotations"])
+
+    for rev in revisions:
+        if not rev.annotations:
+            continue
+
+        try:
+            entries = json.loads(rev.annotations)
+        except (json.JSONDecodeError, TypeError):
+            print(f"Skipping revision {rev.name}: invalid annotations JSON")
+            continue
+
+        if not isinstance(entries, list) or not entries:
+            continue
+
+        existing = frappe.get_all(
+            "IMS Annotation",
+            filters={"parent": rev.name, "parenttype": "IMS Asset Revision"},
+            fields=["annotation_id"],
+        )
+        existing_ids = {r.annotation_id for r in existing}
+
+        # Direct inserts skip the parent-save idx assignment; number the
+        # rows explicitly so they keep the blob's array order
+        next_idx = len(existing) + 1
+
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            if entry.get("id") and entry["id"] in existing_ids:
+                continue
+
+            path = entry.get("path")
+            frappe.get_doc(
+                {
+                    "doctype": "IMS Annotation",
+                    "parent": rev.name,
+                    "parenttype": "IMS Asset Revision",
+                    "parentfield": "annotation_rows",
+                    "idx": next_idx,
+                    "annotation_id": entry.get("id") or frappe.generate_hash(length=10),
+                    "x": entry.get("x") or 0,
+                    "y": entry.get("y") or 0,
+                    "width": entry.get("width") or 0,
+                    "height": entry.get("height") or 0,
+                    "annotation_type": entry.get("annotation_type") or "point",
+                    "comment": entry.get("comment") or "",
+                    "author": entry.get("author"),
+                    "author_name": entry.get("author_name"),
+                    "timestamp": entry.get("timestamp"),
+                    "path": json.dumps(path) if path else None,
+                }
+            ).insert(ignore_permissions=True)
+            next_idx += 1
+
+        print(f"Migrated {len(entries)} annotation(s) for revision {rev.name}")
+
+    frappe.db.commit()